@@ -1,6 +1,7 @@
 import argparse
 import logging
 import os
+import sys
 from typing import cast
 
 # Streamlitはスクリプトを再実行する可能性があるため、引数の解釈と
@@ -8,14 +9,39 @@ from typing import cast
 # これにより、モジュールレベルでの初期化が正しい環境設定で行われることを保証する。
 
 
+_APP_ENVS = ('dev', 'test', 'prod')
+_MAX_SIMPLE_ARGS = 2
+
+
+def _scan_env(argv: list[str]) -> str | None:
+    """argparseを使わずに起動引数からアプリケーション環境を取得する。
+
+    Streamlitはリランのたびにスクリプトを再実行するため、よくある引数の形
+    (`--app-env X`、`--app-env=X`、引数なし)はパーサを組み立てずに解釈する。
+
+    Args:
+        argv: プログラム名を除いた起動引数。
+
+    Returns:
+        環境名。解釈できない場合はNone。
+    """
+    option, _, env = '='.join(argv or ['--app-env', 'dev']).partition('=')
+    is_simple = len(argv) <= _MAX_SIMPLE_ARGS and option == '--app-env' and env in _APP_ENVS
+    return env if is_simple else None
+
+
 def _parse_env() -> str:
     """起動引数からアプリケーション環境を取得する。"""
+    env = _scan_env(sys.argv[1:])
+    if env is not None:
+        return env
+    # 想定外の引数はargparseに任せてエラーやヘルプを表示させる
     parser = argparse.ArgumentParser(description='Streamlit app with selectable environment.')
     parser.add_argument(
         '--app-env',
         type=str,
         default='dev',
-        choices=['dev', 'test', 'prod'],
+        choices=_APP_ENVS,
         help='Application environment (dev, test, or prod)',
     )
     args = parser.parse_args()
@@ -38,7 +64,7 @@ def _initialize_config() -> None:
 
     # ログ設定完了を記録
     logger = logging.getLogger('aiman')
-    logger.info(f'Logging initialized with level: {config.LOG_LEVEL}')
+    logger.info('Logging initialized with level: %s', config.LOG_LEVEL)
 
 
 def main() -> None:
@@ -2,10 +2,28 @@
 
 import logging
 import os
+from functools import cached_property
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger('aiman')
+
+# 環境名の別名と正規化後の名前の対応
+_ENV_ALIASES = {
+    'development': 'dev',
+    'production': 'prod',
+    'prod': 'prod',
+}
+
+# 正規化後の環境名と読み込む .env ファイルの対応
+_ENV_FILE_MAP = {
+    'prod': '.env',
+    'test': '.env.test',
+    'dev': '.env.dev',
+}
+
 
 def _get_environment_config() -> tuple[str, str]:
     """環境設定を取得する。
@@ -21,26 +39,17 @@ def _get_environment_config() -> tuple[str, str]:
         env = 'dev'
 
     # 環境名の正規化
-    env_aliases = {
-        'development': 'dev',
-        'production': 'prod',
-        'prod': 'prod',
-    }
-    normalized_env = env_aliases.get(env, env)
+    normalized_env = _ENV_ALIASES.get(env, env)
 
     # .envファイル名の決定
-    env_file_map = {
-        'prod': '.env',
-        'test': '.env.test',
-        'dev': '.env.dev',
-    }
-    env_file = env_file_map.get(normalized_env, '.env.dev')
+    env_file = _ENV_FILE_MAP.get(normalized_env, '.env.dev')
 
     # ログ出力
-    logger = logging.getLogger('aiman')
     logger.info(
-        f'Environment configuration: ENV={env} -> normalized={normalized_env} -> '
-        f'env_file={env_file}'
+        'Environment configuration: ENV=%s -> normalized=%s -> env_file=%s',
+        env,
+        normalized_env,
+        env_file,
     )
 
     return normalized_env, env_file
@@ -63,6 +72,9 @@ class Config(BaseSettings):
     # フィールド `data_dir` に自動的にマッピングされる
     data_dir: str = '.data'
 
+    # プロジェクトの保存形式（json, sqlite）
+    PROJECT_STORE: Literal['json', 'sqlite'] = 'json'
+
     # LLM設定
     LLM_PROVIDER: str = 'openai'
     OPENAI_API_KEY: str | None = None
@@ -76,21 +88,15 @@ class Config(BaseSettings):
 
     def __init__(self) -> None:
         # 動的に .env* を選択
-        normalized_env, chosen_env_file = _get_environment_config()
-
-        # ログ出力
-        logger = logging.getLogger('aiman')
-        logger.info(
-            f'Loading configuration from {chosen_env_file} for environment {normalized_env}'
-        )
-
+        _, chosen_env_file = _get_environment_config()
         super().__init__(_env_file=chosen_env_file)
 
         # 設定読み込み後のログ出力
-        llm_provider = getattr(self, 'LLM_PROVIDER', 'not set')
-        logger.info(f'Configuration loaded: data_dir={self.data_dir}, LLM_PROVIDER={llm_provider}')
+        logger.info(
+            'Configuration loaded: data_dir=%s, LLM_PROVIDER=%s', self.data_dir, self.LLM_PROVIDER
+        )
 
-    @property
+    @cached_property
     def data_dir_path(self) -> Path:
         """現在の環境に応じたデータディレクトリのパスを返す。
 
@@ -99,11 +105,19 @@ class Config(BaseSettings):
         """
         return Path(self.data_dir)
 
-    @property
+    @cached_property
     def log_file_path(self) -> Path:
-        """ログファイルのパスを返す。"""
+        """ログファイルのパスを返す。
+
+        設定は読み込み後に変化しないため、初回に生成したパスを再利用する。
+        """
         return self.DEFAULT_LOG_DIR / self.DEFAULT_LOG_FILE
 
+    @property
+    def project_store(self) -> Literal['json', 'sqlite']:
+        """プロジェクトの保存形式を返す。"""
+        return self.PROJECT_STORE
+
     # LLM設定
     @property
     def llm_provider(self) -> str:
@@ -158,4 +172,13 @@ assert Config.model_config is not None
 config = Config()
 
 
-__all__ = ['config']
+def get_config() -> Config:
+    """設定インスタンスを取得する。
+
+    Returns:
+        Config: モジュールの読み込み時に1度だけ生成した設定インスタンス。
+    """
+    return config
+
+
+__all__ = ['config', 'get_config']
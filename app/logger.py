@@ -12,13 +12,18 @@ config = app_config
 if TYPE_CHECKING:
     from app.config import Config
 
+# コンソールとファイルで共有するログフォーマッター
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# `setup_logging` が追加したハンドラーに付与する目印の属性名
+HANDLER_MARKER = '_aiman_handler'
+
 
 def _setup_console_handler(config: 'Config') -> logging.StreamHandler[TextIO]:
     """コンソールハンドラーを設定する。"""
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, config.LOG_LEVEL))
-    console_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_FORMATTER)
     return console_handler
 
 
@@ -34,8 +39,7 @@ def _setup_file_handler(config: 'Config') -> logging.handlers.TimedRotatingFileH
         backupCount=config.LOG_ROTATION_DAYS,
     )
     file_handler.setLevel(getattr(logging, config.LOG_LEVEL))
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_formatter)
+    file_handler.setFormatter(_FORMATTER)
 
     return file_handler
 
@@ -47,11 +51,15 @@ def setup_logging() -> None:
 
     # ルートロガーの設定
     root_logger = logging.getLogger()
+    # Streamlitのリランなどで再度呼ばれた場合にハンドラーを重複して追加しない
+    if any(getattr(h, HANDLER_MARKER, False) for h in root_logger.handlers):
+        return
     root_logger.setLevel(getattr(logging, config.LOG_LEVEL))
 
     # ハンドラーの設定
-    root_logger.addHandler(_setup_console_handler(config))
-    root_logger.addHandler(_setup_file_handler(config))
+    for handler in (_setup_console_handler(config), _setup_file_handler(config)):
+        setattr(handler, HANDLER_MARKER, True)
+        root_logger.addHandler(handler)
 
     # アプリケーション固有のロガーの設定
     app_logger = logging.getLogger('aiman')
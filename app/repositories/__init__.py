@@ -1,5 +1,6 @@
 """リポジトリパッケージ。"""
 
-from .project_repository import JsonProjectRepository
+from .project_repository import JsonProjectRepository, ProjectRepositoryProtocol
+from .sqlite_project_repository import SqliteProjectRepository
 
-__all__ = ['JsonProjectRepository']
+__all__ = ['JsonProjectRepository', 'ProjectRepositoryProtocol', 'SqliteProjectRepository']
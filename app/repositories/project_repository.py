@@ -1,10 +1,15 @@
 """プロジェクトのデータアクセスを管理するリポジトリ。"""
 
-import json
 import logging
+import os
 import shutil
+import stat
+import threading
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Literal, Protocol, cast
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
 
 from app.errors import PathIsDirectoryError, ResourceNotFoundError
 from app.models.project import Project
@@ -12,6 +17,77 @@ from app.types import ProjectID
 
 logger = logging.getLogger('aiman')
 
+# 永続化フォーマットから読み戻す対象のフィールド名
+_PROJECT_FIELDS = frozenset(Project.model_fields)
+
+# プロジェクトのリストを一括で検証するアダプター
+_PROJECT_LIST = TypeAdapter(list[Project])
+
+
+def _file_key(path: Path) -> tuple[int, int]:
+    """ファイルの変更を検知するための(更新時刻, サイズ)を返します。"""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _fsync_directory(path: Path) -> None:
+    """ディレクトリを同期し、ディレクトリ内での名前の変更を永続化します。"""
+    # Windowsではディレクトリを開いて同期できないため何もしない
+    if os.name == 'nt':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _path_kind(path: Path) -> Literal['missing', 'file', 'dir']:
+    """1回のstatでパスの種類を判定します。"""
+    try:
+        mode = path.stat().st_mode
+    except FileNotFoundError:
+        return 'missing'
+    return 'dir' if stat.S_ISDIR(mode) else 'file'
+
+
+class ProjectRepositoryProtocol(Protocol):
+    """プロジェクトリポジトリのプロトコル。"""
+
+    def find_by_id(self, project_id: ProjectID) -> Project:
+        """指定されたIDのプロジェクトを取得する。
+
+        Args:
+            project_id: 取得するプロジェクトのID。
+
+        Returns:
+            指定されたIDのプロジェクト。
+
+        Raises:
+            ResourceNotFoundError: 指定されたIDのプロジェクトが見つからない場合。
+        """
+        ...
+
+    def find_all(self) -> list[Project]:
+        """すべてのプロジェクトを取得する。"""
+        ...
+
+    def save(self, project: Project) -> None:
+        """プロジェクトを保存する。
+
+        Args:
+            project: 保存対象のプロジェクト。
+        """
+        ...
+
+    def data_version(self) -> int:
+        """保存先の更新を検知するための値を返す。
+
+        Returns:
+            保存内容が変わると変化する値。
+        """
+        ...
+
 
 class JsonProjectRepository:
     """JSONファイルベースのプロジェクトリポジトリ。"""
@@ -24,6 +100,15 @@ class JsonProjectRepository:
         """
         self.data_dir = data_dir
         self.projects_path = data_dir / 'projects.json'
+        # バックグラウンド実行と画面操作からの同時保存で更新が失われないよう直列化する
+        self._lock = threading.RLock()
+        # 読み込み済みプロジェクトのスナップショットと、その時点のファイルの(更新時刻, サイズ)
+        self._snapshot: list[Project] | None = None
+        self._snapshot_key = (0, 0)
+        # スナップショットと同じ時点の永続化形式(JSON)のレコード
+        self._records: list[dict[str, Any]] = []
+        # プロジェクトIDからスナップショット内の位置への索引
+        self._id_index: dict[ProjectID, int] = {}
         self._ensure_data_dir_exists()
         self._ensure_projects_file_exists()
 
@@ -39,30 +124,65 @@ class JsonProjectRepository:
         Raises:
             ResourceNotFoundError: 指定されたIDのプロジェクトが見つからない場合。
         """
-        projects = self.find_all()
-        project = next((p for p in projects if p.id == project_id), None)
-        if project is None:
-            raise ResourceNotFoundError('Project', project_id)
-        return project
+        with self._lock:
+            projects = self._load_snapshot()
+            index = self._id_index.get(project_id)
+            if index is None:
+                raise ResourceNotFoundError('Project', project_id)
+            project = projects[index]
+        return project.model_copy(deep=True)
 
     def find_all(self) -> list[Project]:
-        """すべてのプロジェクトを取得します。"""
-        projects_data = self._read_json(self.projects_path)
-        normalized = [self._normalize_project_data(p) for p in projects_data]
-        return [Project.model_validate(p) for p in normalized]
+        """すべてのプロジェクトを取得します。
+
+        ファイルが更新されていなければ読み込み済みのスナップショットを再利用し、
+        呼び出し側の変更がキャッシュに影響しないようコピーを返します。
+        """
+        with self._lock:
+            projects = self._load_snapshot()
+        return [p.model_copy(deep=True) for p in projects]
+
+    def data_version(self) -> int:
+        """保存先の更新を検知するための値を返します。
+
+        スナップショットと同じく、ファイルの更新時刻とサイズの両方から求めます。
+
+        Returns:
+            `projects.json`の(更新時刻, サイズ)のハッシュ値。ファイルがない場合は0。
+        """
+        try:
+            return hash(_file_key(self.projects_path))
+        except OSError:
+            return 0
+
+    def _load_snapshot(self) -> list[Project]:
+        """ファイルの更新時刻とサイズを確認し、必要な場合のみ読み込み直します。
+
+        更新時刻の分解能が粗いファイルシステムでも同じ時刻内の書き換えを検知できるよう、
+        サイズもあわせて比較します。
+        """
+        try:
+            file_key = _file_key(self.projects_path)
+        except OSError:
+            self._snapshot = None
+            self._records = []
+            self._id_index = {}
+            return []
+
+        if self._snapshot is None or file_key != self._snapshot_key:
+            self._records = self._read_json(self.projects_path)
+            normalized = [self._normalize_project_data(p) for p in self._records]
+            self._snapshot = _PROJECT_LIST.validate_python(normalized)
+            self._id_index = {p.id: i for i, p in enumerate(self._snapshot)}
+            self._snapshot_key = file_key
+        return self._snapshot
 
     def _normalize_project_data(self, project_data: dict[str, Any]) -> dict[str, Any]:
         """プロジェクトデータを正規化します。"""
-        normalized_project = {}
-
         # 永続化フォーマットからモデルへ読み戻す際に、未知のキーや計算プロパティを除外する。
         # - `Project.model_fields` に存在するキーのみを採用することで、スキーマ外の値を排除する。
         # - 例: 過去の互換フィールドや計算プロパティ（`status` など）はここで弾かれる。
-        for k, v in project_data.items():
-            if k in Project.model_fields:
-                normalized_project[k] = v
-
-        return normalized_project
+        return {k: v for k, v in project_data.items() if k in _PROJECT_FIELDS}
 
     def save(self, project: Project) -> None:
         """プロジェクトを保存します。
@@ -71,42 +191,65 @@ class JsonProjectRepository:
             project: 保存対象の`Project`インスタンス。
                 既存のIDと一致する場合は更新、存在しない場合は追加します。
         """
-        projects = self.find_all()
-        for i, p in enumerate(projects):
-            if p.id == project.id:
-                projects[i] = project
-                break
-        else:
-            projects.append(project)
-        self._save_projects(projects)
+        # 変更のあったプロジェクトのみをシリアライズし、他のレコードはそのまま書き戻す
+        record = project.model_dump(mode='json', exclude={'status'})
+        with self._lock:
+            self._load_snapshot()
+            index = self._id_index.get(project.id)
+            if index is not None and self._records[index] == record:
+                # 保存済みの内容から変わっていなければ書き込みを省く
+                return
+            if index is None:
+                self._records.append(record)
+            else:
+                self._records[index] = record
+            self._save_records()
+            self._apply_to_snapshot(index, project)
 
     def _ensure_data_dir_exists(self) -> None:
         """データディレクトリの存在を確認し、必要に応じて作成します。"""
+        kind = _path_kind(self.data_dir)
         # data_dirがファイルとして存在する場合は、一時的にリネームしてディレクトリを作成
-        if self.data_dir.is_file():
+        if kind == 'file':
             temp_file = self.data_dir.with_suffix('.tmp')
             shutil.move(self.data_dir, temp_file)
             self.data_dir.mkdir(parents=True, exist_ok=True)
             # 元のファイルをprojects.jsonとして移動
             shutil.move(temp_file, self.data_dir / 'projects.json')
-        else:
+        elif kind == 'missing':
             self.data_dir.mkdir(parents=True, exist_ok=True)
 
     def _ensure_projects_file_exists(self) -> None:
         """プロジェクトファイルの存在を確認し、必要に応じて作成します。"""
+        kind = _path_kind(self.projects_path)
         # projects.jsonがディレクトリとして存在する場合はエラー
-        if self.projects_path.exists() and self.projects_path.is_dir():
+        if kind == 'dir':
             raise PathIsDirectoryError(str(self.projects_path))
 
         # プロジェクトファイルが存在しない場合は空のリストで初期化
-        if not self.projects_path.exists():
+        if kind == 'missing':
             self._write_json(self.projects_path, [])
 
-    def _save_projects(self, projects: list[Project]) -> None:
-        """プロジェクトのリストを保存します。"""
-        # status を除外して tool のみを保存
-        projects_data = [p.model_dump(mode='json', exclude={'status'}) for p in projects]
-        self._write_json(self.projects_path, projects_data)
+    def _save_records(self) -> None:
+        """保持しているレコードをファイルに保存します。"""
+        try:
+            self._write_json(self.projects_path, self._records)
+        except Exception:
+            # 書き込みに失敗した場合は、次回の読み込みでファイルから読み直す
+            self._snapshot = None
+            raise
+
+    def _apply_to_snapshot(self, index: int | None, project: Project) -> None:
+        """自身が書き込んだ内容をスナップショットに反映し、ファイルの再読み込みを省きます。"""
+        if self._snapshot is None:
+            return
+        saved = project.model_copy(deep=True)
+        if index is None:
+            self._id_index[project.id] = len(self._snapshot)
+            self._snapshot.append(saved)
+        else:
+            self._snapshot[index] = saved
+        self._snapshot_key = _file_key(self.projects_path)
 
     def _read_json(self, path: Path) -> list[dict[str, Any]]:
         """JSONファイルを読み込みます。"""
@@ -114,22 +257,47 @@ class JsonProjectRepository:
 
         if path.exists():
             try:
-                with open(path, encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(path, 'rb') as f:
+                    data = from_json(f.read())
                     result = cast(list[dict[str, Any]], data)
             except Exception as e:
-                logger.error(f'JSONファイル読み込みエラー: {path}, エラー: {e}')
+                logger.error('JSONファイル読み込みエラー: %s, エラー: %s', path, e)
 
         return result
 
     def _write_json(self, path: Path, data: list[dict[str, Any]]) -> None:
         """JSONファイルに書き込みます。"""
+        self._check_writable(path)
+        # 書き込み量を抑えるためインデントせず、末尾に改行を付ける
+        self._replace_file(path, to_json(data, fallback=str) + b'\n')
+
+    def _check_writable(self, path: Path) -> None:
+        """書き込み先の状態を1回のstatで確認します。"""
+        try:
+            mode = path.stat().st_mode
+        except FileNotFoundError:
+            # ファイルがない場合のみ親ディレクトリの存在を確認する
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return
+
         # ターゲットがディレクトリの場合はエラー
-        if path.exists() and path.is_dir():
+        if stat.S_ISDIR(mode):
             raise PathIsDirectoryError(str(path))
 
-        # 親ディレクトリが存在することを確認
-        path.parent.mkdir(parents=True, exist_ok=True)
+    def _replace_file(self, path: Path, content: bytes) -> None:
+        """一時ファイルに書き込んでからファイルを置き換えます。
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        書き込みの途中で中断されても既存のファイルが壊れないようにします。
+        置き換え後に親ディレクトリも同期し、クラッシュしても置き換えが失われないようにします。
+        """
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        _fsync_directory(path.parent)
@@ -0,0 +1,200 @@
+"""SQLiteベースのプロジェクトリポジトリ。"""
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from app.errors import DataManagerError, ResourceNotFoundError
+from app.models.project import Project
+from app.types import ProjectID
+
+logger = logging.getLogger('aiman')
+
+# プロジェクトのリストを一括で検証するアダプター
+_PROJECT_LIST = TypeAdapter(list[Project])
+
+_CREATE_TABLE_SQL = 'CREATE TABLE IF NOT EXISTS projects (id TEXT PRIMARY KEY, data TEXT NOT NULL)'
+_CREATE_META_TABLE_SQL = (
+    'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+)
+
+# projects.jsonの取り込みが完了したことを記録するメタデータのキー
+_JSON_IMPORTED_KEY = 'json_imported'
+
+# 既存の行は更新して rowid(登録順)を保ち、内容が同じ場合は書き換えない
+_UPSERT_SQL = (
+    'INSERT INTO projects (id, data) VALUES (?, ?) '
+    'ON CONFLICT(id) DO UPDATE SET data = excluded.data WHERE data != excluded.data'
+)
+
+# 取り込み時は、データベース側に既にある行を上書きしない
+_IMPORT_SQL = 'INSERT INTO projects (id, data) VALUES (?, ?) ON CONFLICT(id) DO NOTHING'
+
+
+@contextmanager
+def _wrap_db_errors(action: str) -> Iterator[None]:
+    """SQLiteのエラーを`DataManagerError`に変換します。
+
+    Args:
+        action: エラーメッセージに含める操作の説明。
+
+    Raises:
+        DataManagerError: SQLiteの操作に失敗した場合。
+    """
+    try:
+        yield
+    except sqlite3.Error as e:
+        logger.error('%sに失敗しました: %s', action, e)
+        raise DataManagerError(f'{action}に失敗しました: {e}') from e
+
+
+class SqliteProjectRepository:
+    """SQLiteベースのプロジェクトリポジトリ。
+
+    プロジェクトごとに1行で保存するため、更新時は対象の行だけを書き換えます。
+    """
+
+    def __init__(self, data_dir: Path) -> None:
+        """リポジトリを初期化します。
+
+        既存の`projects.json`の内容をまだ取り込んでいない場合は取り込みます。
+
+        Args:
+            data_dir: データファイルを保存するディレクトリのパス。
+
+        Raises:
+            DataManagerError: データベースの初期化、または`projects.json`の取り込みに失敗した場合。
+        """
+        self.data_dir = data_dir
+        self.db_path = data_dir / 'projects.db'
+        data_dir.mkdir(parents=True, exist_ok=True)
+        # 画面操作とバックグラウンド実行のスレッドで共有するため、ロックで直列化する
+        self._lock = threading.Lock()
+        # この接続から内容を変更した回数(他の接続による変更は`PRAGMA data_version`で検知する)
+        self._write_count = 0
+        with _wrap_db_errors('データベースの初期化'):
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            self._initialize_schema()
+            if not self._is_json_imported():
+                self._import_json_projects()
+        except DataManagerError:
+            self._conn.close()
+            raise
+
+    def find_by_id(self, project_id: ProjectID) -> Project:
+        """指定されたIDのプロジェクトを取得します。
+
+        Args:
+            project_id: 取得するプロジェクトのID。
+
+        Returns:
+            指定されたIDのプロジェクト。
+
+        Raises:
+            ResourceNotFoundError: 指定されたIDのプロジェクトが見つからない場合。
+            DataManagerError: データベースの読み込みに失敗した場合。
+        """
+        with self._lock, _wrap_db_errors('プロジェクトの読み込み'):
+            row = self._conn.execute(
+                'SELECT data FROM projects WHERE id = ?', (str(project_id),)
+            ).fetchone()
+        if row is None:
+            raise ResourceNotFoundError('Project', project_id)
+        return Project.model_validate_json(row[0])
+
+    def find_all(self) -> list[Project]:
+        """すべてのプロジェクトを登録順に取得します。
+
+        Raises:
+            DataManagerError: データベースの読み込みに失敗した場合。
+        """
+        with self._lock, _wrap_db_errors('プロジェクト一覧の読み込み'):
+            rows = self._conn.execute('SELECT data FROM projects ORDER BY rowid').fetchall()
+        # 各行のJSONを配列にまとめ、1回の呼び出しで検証する
+        return _PROJECT_LIST.validate_json('[' + ','.join(data for (data,) in rows) + ']')
+
+    def save(self, project: Project) -> None:
+        """プロジェクトを保存します。
+
+        Args:
+            project: 保存対象の`Project`インスタンス。
+                既存のIDと一致する場合は更新、存在しない場合は追加します。
+
+        Raises:
+            DataManagerError: データベースへの書き込みに失敗した場合。
+        """
+        row = (str(project.id), project.model_dump_json(exclude={'status'}))
+        with self._lock, _wrap_db_errors('プロジェクトの保存'), self._conn:
+            if self._conn.execute(_UPSERT_SQL, row).rowcount:
+                self._write_count += 1
+
+    def data_version(self) -> int:
+        """保存先の更新を検知するための値を返します。
+
+        ファイルの更新時刻は分解能が粗いと同じ時刻内の書き込みを取りこぼすため、
+        この接続からの変更回数と、他の接続による変更で値が変わる`PRAGMA data_version`を用います。
+
+        Returns:
+            変更回数と`PRAGMA data_version`のハッシュ値。
+
+        Raises:
+            DataManagerError: データベースの読み込みに失敗した場合。
+        """
+        with self._lock, _wrap_db_errors('データベースの読み込み'):
+            (external_version,) = self._conn.execute('PRAGMA data_version').fetchone()
+            return hash((self._write_count, external_version))
+
+    def close(self) -> None:
+        """データベース接続を閉じます。"""
+        with self._lock:
+            self._conn.close()
+
+    def _initialize_schema(self) -> None:
+        """接続の設定を行い、テーブルがなければ作成します。"""
+        with self._lock, _wrap_db_errors('データベースの初期化'):
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(_CREATE_TABLE_SQL)
+            self._conn.execute(_CREATE_META_TABLE_SQL)
+
+    def _is_json_imported(self) -> bool:
+        """`projects.json`の取り込みが完了しているかを返します。"""
+        with self._lock, _wrap_db_errors('データベースの初期化'):
+            row = self._conn.execute(
+                'SELECT 1 FROM meta WHERE key = ?', (_JSON_IMPORTED_KEY,)
+            ).fetchone()
+        return row is not None
+
+    def _import_json_projects(self) -> None:
+        """既存の`projects.json`があれば、その内容を取り込みます。
+
+        取り込んだ行と完了の記録は1つのトランザクションで書き込むため、
+        失敗した場合は何も書き込まれず、次回の初期化で再び取り込みます。
+
+        Raises:
+            DataManagerError: `projects.json`の読み込みまたは取り込みに失敗した場合。
+        """
+        json_path = self.data_dir / 'projects.json'
+        projects: list[Project] = []
+        if json_path.is_file():
+            try:
+                projects = _PROJECT_LIST.validate_json(json_path.read_bytes())
+            except (OSError, PydanticValidationError) as e:
+                logger.error('projects.jsonの取り込みに失敗しました: %s', e)
+                raise DataManagerError(f'projects.jsonの取り込みに失敗しました: {e}') from e
+        rows = [(str(p.id), p.model_dump_json(exclude={'status'})) for p in projects]
+        with self._lock, _wrap_db_errors('projects.jsonの取り込み'), self._conn:
+            self._conn.executemany(_IMPORT_SQL, rows)
+            self._conn.execute(
+                'INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO NOTHING',
+                (_JSON_IMPORTED_KEY, '1'),
+            )
+        if rows:
+            logger.info('projects.jsonから%d件のプロジェクトを取り込みました', len(rows))
@@ -2,15 +2,19 @@
 
 import logging
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from app.config import config
 from app.errors import (
     LLMError,
     ResourceNotFoundError,
+    WorkerError,
 )
 from app.models.project import Project
-from app.repositories.project_repository import JsonProjectRepository
+from app.repositories.project_repository import ProjectRepositoryProtocol
 from app.types import LLMProviderName, ProjectID, ToolType
 from app.utils.async_helper import run_async
 from app.utils.file_system import FileSystemProtocol, RealFileSystem
@@ -21,13 +25,30 @@ from app.utils.semantic_index import build_faiss_index
 
 logger = logging.getLogger('aiman')
 
+# エラー種別ごとのメッセージ取得関数（先に一致したものを使用）
+_ERROR_MESSAGE_HANDLERS: dict[type[Exception], Callable[[Exception], str]] = {
+    # ValueError は元のエラーメッセージをそのまま返す（例: ファイル未検出など）
+    ValueError: str,
+    ResourceNotFoundError: str,
+    LLMError: lambda e: getattr(e, 'message', str(e)),
+}
+
+# ツール種別ごとの結果出力ファイル名
+_OUTPUT_FILENAMES: dict[ToolType, str] = {
+    ToolType.OVERVIEW: 'overview.txt',
+    ToolType.REVIEW: 'review.txt',
+}
+
+# REVIEWの対象とするファイルの拡張子。先頭ほど優先する
+_REVIEW_TARGET_SUFFIXES = ('.md', '.txt', '.py')
+
 
 class ProjectService:
     """プロジェクトのビジネスロジックを管理するサービス。"""
 
     def __init__(
         self,
-        repository: JsonProjectRepository,
+        repository: ProjectRepositoryProtocol,
         file_system: FileSystemProtocol | None = None,
         llm_client_factory: Callable[[], LLMClient] | None = None,
     ):
@@ -70,8 +91,8 @@ class ProjectService:
             # 作成直後にインデックスを構築（失敗しても作成は成功扱い）
             self.build_project_index(project)
             result = project
-        except Exception as e:
-            logger.error(f'[ERROR] プロジェクト作成エラー: {e}')
+        except (OSError, WorkerError, ValidationError) as e:
+            logger.error('[ERROR] プロジェクト作成エラー: %s', e)
             result = None
 
         return result
@@ -85,8 +106,10 @@ class ProjectService:
         project.start_indexing()
         self.repository.save(project)
 
-        self._build_project_vector_index(project)
-        self._build_project_keyword_index(project)
+        # ベクタ/キーワードインデックスは互いに独立しているため並行して構築する
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(self._build_project_vector_index, project)
+            executor.submit(self._build_project_keyword_index, project)
 
         project.finish_indexing()
         self.repository.save(project)
@@ -103,7 +126,7 @@ class ProjectService:
             provider = LLMProviderName(config.llm_provider)
             build_faiss_index(source_dir, index_dir, provider)
         except Exception as ie:
-            logger.error(f'[ERROR] ベクタDB作成エラー: {ie}')
+            logger.error('[ERROR] ベクタDB作成エラー: %s', ie)
 
     def _build_project_keyword_index(self, project: Project) -> None:
         """プロジェクト用のBM25キーワードインデックスを構築する。
@@ -116,7 +139,7 @@ class ProjectService:
             index_dir = source_dir / 'keyword_db'
             build_keyword_index(source_dir, index_dir)
         except Exception as ie:
-            logger.error(f'[ERROR] キーワードインデックス作成エラー: {ie}')
+            logger.error('[ERROR] キーワードインデックス作成エラー: %s', ie)
 
     def rebuild_project_indexes(self, project_id: ProjectID) -> tuple[Project | None, str]:
         """プロジェクトのインデックスを再構築する。
@@ -127,7 +150,7 @@ class ProjectService:
         Returns:
             (更新されたプロジェクト, メッセージ)
         """
-        logger.debug(f'[DEBUG] rebuild_project_indexes開始: project_id={project_id}')
+        logger.debug('[DEBUG] rebuild_project_indexes開始: project_id=%s', project_id)
         project: Project | None = None
 
         try:
@@ -160,7 +183,7 @@ class ProjectService:
         Returns:
             (プロジェクト, エラーメッセージ)
         """
-        logger.error(f'[ERROR] インデックス再構築エラー: {error}')
+        logger.error('[ERROR] インデックス再構築エラー: %s', error)
         if project:
             project.finish_indexing()
             self.repository.save(project)
@@ -175,7 +198,7 @@ class ProjectService:
         Returns:
             (更新されたプロジェクト, メッセージ)
         """
-        logger.debug(f'[DEBUG] execute_project開始: project_id={project_id}')
+        logger.debug('[DEBUG] execute_project開始: project_id=%s', project_id)
         project: Project | None = None
 
         try:
@@ -199,9 +222,18 @@ class ProjectService:
         project.complete({'message': 'プロジェクトの実行が完了しました。'})
         self.repository.save(project)
 
+    def _start_processing(self, project: Project) -> None:
+        """処理開始を記録し、実行中であることを他のセッションからも参照できるよう永続化します。
+
+        Args:
+            project: プロジェクト。
+        """
+        project.start_processing()
+        self.repository.save(project)
+
     def _execute_internal_tool(self, project: Project) -> None:
         """内蔵ツールで処理を実行する。"""
-        project.start_processing()
+        self._start_processing(project)
 
         try:
             # プロンプト生成
@@ -220,7 +252,7 @@ class ProjectService:
             self._handle_llm_error(project, e)
             raise
         except Exception as e:
-            logger.error(f'[ERROR] 内蔵ツール実行エラー: {e}')
+            logger.error('[ERROR] 内蔵ツール実行エラー: %s', e)
             project.fail({'error': str(e)})
             raise
 
@@ -236,11 +268,12 @@ class ProjectService:
             'LLM呼び出しエラー: LLM呼び出しエラー:', 'LLM呼び出しエラー:'
         )
 
-        error_msg = f'[ERROR] {clean_message} (プロバイダ: {error.provider}, モデル: {error.model})'
-        logger.error(error_msg)
+        logger.error(
+            '[ERROR] %s (プロバイダ: %s, モデル: %s)', clean_message, error.provider, error.model
+        )
 
         if error.original_error:
-            logger.error(f'[ERROR] 元のエラー: {error.original_error}')
+            logger.error('[ERROR] 元のエラー: %s', error.original_error)
 
         project.fail({'error': clean_message, 'provider': error.provider, 'model': error.model})
 
@@ -300,14 +333,31 @@ class ProjectService:
             (None, エラーメッセージ)
         """
         message = self._get_error_message(error)
-        logger.error(f'[ERROR] {message}')
+        logger.error('[ERROR] %s', message)
 
-        if project and not isinstance(error, ValueError | ResourceNotFoundError):
-            project.fail({'error': str(error)})
-            self.repository.save(project)
+        if project:
+            self._save_failure(project, error)
 
         return None, message
 
+    def _save_failure(self, project: Project, error: Exception) -> None:
+        """実行の失敗をプロジェクトに反映して保存します。
+
+        入力の不備による失敗 `ValueError` と `ResourceNotFoundError` は、
+        開始時に保存した処理中の状態を未実行に戻し、再実行できるようにします。
+
+        Args:
+            project: プロジェクト。
+            error: 発生したエラー。
+        """
+        if isinstance(error, ValueError | ResourceNotFoundError):
+            project.executed_at = None
+            project.finished_at = None
+            project.result = None
+        else:
+            project.fail({'error': str(error)})
+        self.repository.save(project)
+
     def _get_error_message(self, error: Exception) -> str:
         """エラーメッセージを取得する。
 
@@ -317,14 +367,7 @@ class ProjectService:
         Returns:
             エラーメッセージ。
         """
-        error_handlers: dict[type[Exception], Callable[[Exception], str]] = {
-            # ValueError は元のエラーメッセージをそのまま返す（例: ファイル未検出など）
-            ValueError: lambda e: str(e),
-            ResourceNotFoundError: lambda e: str(e),
-            LLMError: lambda e: getattr(e, 'message', str(e)),
-        }
-
-        for error_type, handler in error_handlers.items():
+        for error_type, handler in _ERROR_MESSAGE_HANDLERS.items():
             if isinstance(error, error_type):
                 return handler(error)
 
@@ -452,7 +495,7 @@ class ProjectService:
                 content = self.file_system.read_file(file_path)
                 file_contents[relative_path] = content
             except Exception as e:
-                logger.warning(f'[WARNING] ファイル読み込みエラー {file_path}: {e}')
+                logger.warning('[WARNING] ファイル読み込みエラー %s: %s', file_path, e)
 
     def _generate_review_prompt(self, project: Project) -> str:
         """REVIEWツール用プロンプトを生成する。
@@ -482,18 +525,35 @@ class ProjectService:
         Returns:
             (ファイルパス, ファイル内容)のタプル。
         """
-        # 優先順で探索: .md -> .txt -> .py
-        for pattern in ('*.md', '*.txt', '*.py'):
-            file_list, file_contents = self._scan_files_with_pattern(
-                source_path, pattern, include_content=True
-            )
-            if file_list:
-                first_file = file_list[0]
-                file_content = file_contents.get(first_file, '')
-                target_file = source_path / first_file
-                return target_file, file_content
-
-        return None, ''
+        target_file = self._select_review_target_file(source_path)
+        if target_file is None:
+            return None, ''
+
+        # 内容は選ばれたファイルのみ読み込む
+        file_contents: dict[str, str] = {}
+        self._read_file_content_if_text(target_file, str(target_file), file_contents)
+        return target_file, file_contents.get(str(target_file), '')
+
+    def _select_review_target_file(self, source_path: Path) -> Path | None:
+        """ディレクトリを1回だけ走査し、拡張子の優先順で最初のファイルを選ぶ。
+
+        Args:
+            source_path: ソースディレクトリパス。
+
+        Returns:
+            対象ファイルのパス。見つからない場合はNone。
+        """
+        if not self._is_valid_source_path(source_path):
+            return None
+
+        # 拡張子ごとに最初に見つかったファイルを記録する
+        first_by_suffix: dict[str, Path] = {}
+        for file_path in self.file_system.list_files(source_path, '*'):
+            first_by_suffix.setdefault(file_path.suffix, file_path)
+
+        return next(
+            (first_by_suffix[s] for s in _REVIEW_TARGET_SUFFIXES if s in first_by_suffix), None
+        )
 
     def _save_tool_result(self, project: Project, response: str) -> None:
         """ツール実行結果をファイルに保存する。
@@ -503,12 +563,21 @@ class ProjectService:
             response: LLMからの応答。
         """
         # 出力先は対象ディレクトリ配下の固定ファイル名
-        output_filename = 'overview.txt' if project.tool == ToolType.OVERVIEW else 'review.txt'
+        output_filename = _OUTPUT_FILENAMES.get(project.tool, 'review.txt')
         output_path = Path(project.source) / output_filename
 
         content = f'# {project.tool} result\n\n{response}\n'
         self.file_system.write_file(output_path, content)
 
     def _is_valid_input(self, name: str, source: str, tool: ToolType) -> bool:
-        """入力値の妥当性チェック。"""
-        return bool(name and name.strip()) and bool(source and source.strip()) and tool is not None
+        """入力値の妥当性チェック。
+
+        `strip()` による文字列生成を避けるため、空白のみの判定は `isspace()` で行う。
+        """
+        return (
+            bool(name)
+            and not name.isspace()
+            and bool(source)
+            and not source.isspace()
+            and tool is not None
+        )
@@ -6,8 +6,10 @@ from dataclasses import dataclass
 
 import streamlit as st
 
+logger = logging.getLogger('aiman')
 
-@dataclass
+
+@dataclass(slots=True)
 class ModalButtonConfig:
     """モーダルボタンの設定。"""
 
@@ -19,8 +21,7 @@ class ModalButtonConfig:
 def _log_button_action(log_context: str | None) -> None:
     """ボタンアクションのログを出力する。"""
     if log_context:
-        logger = logging.getLogger('aiman')
-        logger.info(f'[Streamlit] ボタン押下: {log_context}')
+        logger.info('[Streamlit] ボタン押下: %s', log_context)
 
 
 def _display_action_result(
@@ -67,8 +68,7 @@ def handle_button_action(
             st.rerun()
     except Exception as e:
         # 予期しないエラーの場合
-        logger = logging.getLogger('aiman')
-        logger.error(f'[Streamlit] ボタンアクション実行エラー: {e}')
+        logger.error('[Streamlit] ボタンアクション実行エラー: %s', e)
         st.error('予期しないエラーが発生しました。')
 
 
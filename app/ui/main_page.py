@@ -6,20 +6,20 @@ from pathlib import Path
 import streamlit as st
 from streamlit_modal import Modal
 
-from app.config import Config as _ConfigType
-from app.config import config
+from app.config import get_config
 from app.logger import setup_logging
-from app.repositories.project_repository import JsonProjectRepository
 from app.services.project_service import ProjectService
 from app.ui.project_creation_form import render_project_creation_form
 from app.ui.project_detail_modal import render_project_detail_modal
-from app.ui.project_list import render_project_list
+from app.ui.project_list import prune_finished_workers, render_project_list
+from app.ui.resources import get_project_service, load_projects
 
-# ログ設定の初期化（ここでは二重初期化を避けるため呼ばない）
+logger = logging.getLogger('aiman.ui')
 
+# ログ設定の初期化（ここでは二重初期化を避けるため呼ばない）
 
-def get_config() -> _ConfigType:
-    return config
+# 実行中のプロジェクトがある間、プロジェクト一覧を更新する間隔(秒)
+_AUTO_REFRESH_SECONDS = 2.0
 
 
 def _ensure_projects_root(base_path: Path) -> None:
@@ -29,8 +29,25 @@ def _ensure_projects_root(base_path: Path) -> None:
         projects_root.mkdir(parents=True, exist_ok=True)
     except OSError:
         # 一部テスト環境などでルート配下が読み取り専用の場合があるため、失敗しても続行
-        logger = logging.getLogger('aiman.ui')
-        logger.warning(f'プロジェクト用ディレクトリを作成できませんでした: {projects_root}')
+        logger.warning('プロジェクト用ディレクトリを作成できませんでした: %s', projects_root)
+
+
+def _render_project_section(data_dir: Path, modal: Modal, project_service: ProjectService) -> None:
+    """プロジェクト一覧を読み込んで描画します。
+
+    実行中のプロジェクトがすべて完了した場合は、自動更新を止めるためページ全体を再実行します。
+    完了した実行の結果は、再実行後の描画で表示されます。
+
+    Args:
+        data_dir: データディレクトリのパス。
+        modal: 詳細表示用のModalオブジェクト。
+        project_service: プロジェクトサービス。
+    """
+    was_running = bool(st.session_state.get('running_workers'))
+    if was_running and not prune_finished_workers():
+        st.rerun()
+    projects = load_projects(data_dir)
+    render_project_list(projects, modal, project_service)
 
 
 def render_main_page() -> None:
@@ -41,14 +58,13 @@ def render_main_page() -> None:
 
     # データディレクトリの表示とログ初期化
     setup_logging()
-    logging.getLogger('aiman.ui').info(f'Data directory: {cfg.data_dir_path}')
+    logger.info('Data directory: %s', cfg.data_dir_path)
 
     # プロジェクト用ディレクトリの作成（存在しなければ作成）
     _ensure_projects_root(cfg.data_dir_path)
 
-    # リポジトリとサービスの初期化
-    project_repo = JsonProjectRepository(cfg.data_dir_path)
-    project_service = ProjectService(project_repo)
+    # サービスの取得（リラン間でキャッシュ共有）
+    project_service = get_project_service(cfg.data_dir_path)
 
     # プロジェクト作成フォームを表示（projects ルートを渡す）
     render_project_creation_form(project_service, cfg.data_dir_path / 'projects')
@@ -56,9 +72,10 @@ def render_main_page() -> None:
     # プロジェクト一覧を表示
     modal = Modal('プロジェクト詳細', key='project_detail_modal')
 
-    # プロジェクトリポジトリからプロジェクトを取得
-    projects = project_repo.find_all()
-    render_project_list(projects, modal, project_service)
+    # プロジェクト一覧を表示（実行中のみ一覧部分だけを定期的に再実行）
+    run_every = _AUTO_REFRESH_SECONDS if st.session_state.get('running_workers') else None
+    project_section = st.fragment(run_every=run_every)(_render_project_section)
+    project_section(cfg.data_dir_path, modal, project_service)
 
     # プロジェクト詳細モーダルを表示
     render_project_detail_modal(modal)
@@ -5,18 +5,40 @@ from pathlib import Path
 
 import streamlit as st
 
+from app.errors import WorkerError
 from app.models.project import Project
 from app.services.project_service import ProjectService
 from app.types import ToolType
+from app.ui.resources import load_source_dirs
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectFormInputs:
     project_name: str | None
     source_dir: str | None
     selected_tool_type: ToolType | None = None
 
 
+_REQUIRED_TEXT_MESSAGE = 'プロジェクト名と対象ディレクトリのパスを入力してください。'
+_REQUIRED_TOOL_MESSAGE = '内蔵ツールを選択してください。'
+
+# 選択肢の未選択表示
+_UNSELECTED_LABEL = '選択...'
+
+# 内蔵ツール（固定2択）
+_INTERNAL_TOOL_OPTIONS: tuple[ToolType | None, ...] = (None, ToolType.OVERVIEW, ToolType.REVIEW)
+
+
+def _format_option(value: object) -> str:
+    """選択肢を表示用の文字列に変換する(未選択は `選択...`)。"""
+    return _UNSELECTED_LABEL if value is None else str(value)
+
+
+def _is_blank(value: str | None) -> bool:
+    """未入力または空白文字のみかを判定する。"""
+    return not value or value.isspace()
+
+
 def _validate_project_inputs(
     project_name: str | None,
     source_dir: str | None,
@@ -27,23 +49,14 @@ def _validate_project_inputs(
     Returns:
         (検証成功フラグ, エラーメッセージ)
     """
-    error_message = ''
-
-    # 空白文字のチェックを追加
-    if (
-        not project_name
-        or (project_name and not project_name.strip())
-        or not source_dir
-        or (source_dir and not source_dir.strip())
-    ):
-        error_message = 'プロジェクト名と対象ディレクトリのパスを入力してください。'
-    elif selected_tool_type is None:
-        error_message = '内蔵ツールを選択してください。'
-
-    if error_message:
-        return False, error_message
-
-    return True, ''
+    # 先頭から順に検証し、最初に該当したエラーメッセージを返す
+    checks = (
+        (_is_blank(project_name), _REQUIRED_TEXT_MESSAGE),
+        (_is_blank(source_dir), _REQUIRED_TEXT_MESSAGE),
+        (selected_tool_type is None, _REQUIRED_TOOL_MESSAGE),
+    )
+    error_message = next((message for failed, message in checks if failed), '')
+    return not error_message, error_message
 
 
 def _create_project_with_validation(
@@ -66,7 +79,7 @@ def _create_project_with_validation(
         else:
             message = 'プロジェクトを作成しました。'
         return created_project is not None, message
-    except Exception:
+    except (OSError, WorkerError):
         return False, 'プロジェクトの作成に失敗しました。'
 
 
@@ -81,23 +94,19 @@ def _render_form_inputs(
     project_name: str | None = st.text_input('プロジェクト名')
 
     # projects 配下のサブディレクトリ一覧を取得し、選択式にする
-    subdirs: list[str] = []
-    if projects_root is not None and projects_root.exists():
-        subdirs = [p.name for p in projects_root.iterdir() if p.is_dir()]
+    subdirs = load_source_dirs(projects_root) if projects_root is not None else []
     source_choice_options: list[str | None] = [None, *subdirs]
     selected_subdir: str | None = st.selectbox(
         '対象ディレクトリ',
         options=source_choice_options,
-        format_func=lambda s: '選択...' if s is None else s,
+        format_func=_format_option,
         index=0,
     )
     source_dir: str | None = selected_subdir
-    # 内蔵ツール（固定2択）
-    internal_tool_options: list[ToolType | None] = [None, ToolType.OVERVIEW, ToolType.REVIEW]
     selected_tool_type: ToolType | None = st.selectbox(
         '内蔵ツールを選択',
-        options=internal_tool_options,
-        format_func=lambda t: '選択...' if t is None else str(t),
+        options=_INTERNAL_TOOL_OPTIONS,
+        format_func=_format_option,
         index=0,
     )
 
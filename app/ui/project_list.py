@@ -1,26 +1,52 @@
 """プロジェクト一覧のUIコンポーネント。"""
 
+import logging
+from concurrent.futures import Future
+from datetime import datetime
+
 import streamlit as st
 from streamlit_modal import Modal
 
 from app.models.project import Project
 from app.services.project_service import ProjectService
-from app.types import ProjectStatus
+from app.types import ProjectID, ProjectStatus
 from app.ui.button_handlers import ModalButtonConfig, handle_button_action, handle_modal_button
+from app.ui.resources import get_execution_executor
+
+logger = logging.getLogger('aiman')
+
+# プロジェクトの状態ごとの表示アイコン(該当しない場合は '💬')
+_STATUS_ICONS: dict[ProjectStatus, str] = {
+    ProjectStatus.PROCESSING: '⏳',
+    ProjectStatus.COMPLETED: '✅',
+    ProjectStatus.FAILED: '❌',
+}
+
+# 完了したバックグラウンド実行の結果を、次の描画で表示するまで保持するセッション状態のキー
+_EXECUTION_RESULTS_KEY = 'execution_results'
+
+# 一覧のヘッダーと各行の列幅
+_HEADER_COL_WIDTHS = (1, 4, 2, 2, 1, 1)
+_ROW_COL_WIDTHS = (1, 4, 1, 1, 1, 1)
+
+# 一覧に表示する日時の書式
+_DATETIME_FORMAT = '%Y/%m/%d %H:%M'
+
+
+def _format_datetime(value: datetime | None) -> str:
+    """日時を一覧表示用の文字列に整形します(未設定の場合は空文字)。"""
+    if value is None:
+        return ''
+    return value.strftime(_DATETIME_FORMAT)
 
 
 def _get_status_icon(project: Project, is_running: bool) -> str:
-    status_icon_map = {
-        ProjectStatus.PROCESSING: '⏳',
-        ProjectStatus.COMPLETED: '✅',
-        ProjectStatus.FAILED: '❌',
-    }
-    return '🏃' if is_running else status_icon_map.get(project.status, '💬')
+    return '🏃' if is_running else _STATUS_ICONS.get(project.status, '💬')
 
 
 def _render_header_columns() -> None:
     """プロジェクト一覧のヘッダーを描画します。"""
-    header_cols = st.columns((1, 4, 2, 2, 1, 1))
+    header_cols = st.columns(_HEADER_COL_WIDTHS)
     header_cols[0].write('**No.**')
     header_cols[1].write('**プロジェクト名**')
     header_cols[2].write('**作成日時**')
@@ -40,11 +66,11 @@ def render_project_list(
         modal: 詳細表示用のModalオブジェクト。
         project_service: プロジェクトサービス。
     """
-    # running_workersの初期化
-    if 'running_workers' not in st.session_state:
-        st.session_state.running_workers = {}
+    # running_workersの初期化と完了済み実行の除去。描画中は同じ実行中IDの集合を参照する
+    running_ids = prune_finished_workers()
 
     st.header('プロジェクト一覧')
+    _show_execution_results()
 
     if not projects:
         st.info('まだプロジェクトがありません。')
@@ -53,28 +79,87 @@ def render_project_list(
     _render_header_columns()
 
     for i, p in enumerate(projects):
-        _render_project_row(i, p, modal, project_service)
+        _render_project_row(i, p, modal, project_service, is_running=p.id in running_ids)
+
+
+def prune_finished_workers() -> frozenset[ProjectID]:
+    """完了したバックグラウンド実行を `running_workers` から取り除きます。
+
+    セッション状態への再代入を避け、保持している辞書をその場で更新します。
+    完了した実行の結果は、次の描画で表示するためセッション状態に保持します。
+
+    Returns:
+        実行中のプロジェクトIDの集合。
+    """
+    running_workers = st.session_state.setdefault('running_workers', {})
+    finished = [project_id for project_id, future in running_workers.items() if future.done()]
+    if finished:
+        results = st.session_state.setdefault(_EXECUTION_RESULTS_KEY, [])
+        for project_id in finished:
+            results.append(_get_execution_result(running_workers.pop(project_id)))
+    return frozenset(running_workers)
+
 
+def _get_execution_result(future: Future[tuple[Project | None, str]]) -> tuple[bool, str]:
+    """完了したバックグラウンド実行の結果を取得します。
 
-def _render_project_row(
+    Returns:
+        (成功フラグ, メッセージ)
+    """
+    try:
+        project, message = future.result()
+    except Exception as e:
+        logger.error('[Streamlit] プロジェクト実行エラー: %s', e)
+        return False, '予期しないエラーが発生しました。'
+    return project is not None, message
+
+
+def _show_execution_results() -> None:
+    """保持しているバックグラウンド実行の結果を表示し、破棄します。"""
+    for success, message in st.session_state.pop(_EXECUTION_RESULTS_KEY, []):
+        if success:
+            st.success(message)
+        else:
+            st.error(message)
+
+
+def _start_project_execution(project: Project, project_service: ProjectService) -> tuple[bool, str]:
+    """プロジェクトの実行をバックグラウンドで開始します。
+
+    Args:
+        project: 実行対象のプロジェクト。
+        project_service: プロジェクトサービス。
+
+    Returns:
+        (成功フラグ, メッセージ)
+    """
+    future = get_execution_executor().submit(project_service.execute_project, project.id)
+    st.session_state.setdefault('running_workers', {})[project.id] = future
+    return True, 'プロジェクトの実行を開始しました。'
+
+
+def _render_project_row(  # noqa: PLR0913
     index: int,
     project: Project,
     modal: Modal,
     project_service: ProjectService,
+    *,
+    is_running: bool = False,
 ) -> None:
     """プロジェクトの各行を描画します。"""
-    is_running = project.id in st.session_state.running_workers
     status_icon = _get_status_icon(project, is_running)
 
-    row_cols = st.columns((1, 4, 1, 1, 1, 1))
+    row_cols = st.columns(_ROW_COL_WIDTHS)
     row_cols[0].write(str(index + 1))
     row_cols[1].write(f'{status_icon} {project.name}')
-    row_cols[2].write(project.created_at.strftime('%Y/%m/%d %H:%M'))
-    row_cols[3].write(
-        project.executed_at.strftime('%Y/%m/%d %H:%M') if project.executed_at is not None else '',
-    )
+    row_cols[2].write(_format_datetime(project.created_at))
+    row_cols[3].write(_format_datetime(project.executed_at))
     detail_btn = row_cols[4].button('詳細', key=f'detail_{project.id}')
-    exec_btn = project.executed_at is None and row_cols[5].button('実行', key=f'run_{project.id}')
+    exec_btn = (
+        project.executed_at is None
+        and not is_running
+        and row_cols[5].button('実行', key=f'run_{project.id}')
+    )
 
     _handle_project_buttons(
         {'detail_btn': detail_btn, 'exec_btn': exec_btn},
@@ -103,10 +188,9 @@ def _handle_project_buttons(
         log_context=f'project_id={project.id}',
     )
 
-    # 実行ボタンの処理
+    # 実行ボタンの処理（画面をブロックしないようバックグラウンドで実行）
     def execute_project_action() -> tuple[bool, str]:
-        updated_project, message = project_service.execute_project(project.id)
-        return updated_project is not None, message
+        return _start_project_execution(project, project_service)
 
     handle_button_action(
         button_clicked=button_state['exec_btn'],
@@ -116,4 +200,4 @@ def _handle_project_buttons(
     )
 
 
-__all__ = ['render_project_list', 'st']
+__all__ = ['prune_finished_workers', 'render_project_list', 'st']
@@ -13,7 +13,7 @@ from rank_bm25 import BM25Okapi
 
 from app.config import config
 from app.models.project import Project
-from app.repositories.project_repository import JsonProjectRepository
+from app.repositories.project_repository import ProjectRepositoryProtocol
 from app.services.project_service import ProjectService
 from app.types import LLMProviderName
 from app.utils.async_helper import run_async
@@ -26,11 +26,114 @@ JST = ZoneInfo('Asia/Tokyo')
 
 logger = logging.getLogger('aiman')
 
+# プロセス内に保持する読み込み済みインデックスの最大数
+_MAX_CACHED_INDEXES = 8
+
+# 検索結果ログに表示する本文プレビューの最大文字数
+_LOG_PREVIEW_CHARS = 100
+
+
+def _format_result_lines(title: str, results: list[dict[str, Any]]) -> list[str]:
+    """検索結果をログ表示用の行に整形する。
+
+    本文はプレビューとして先頭のみを表示し、チャンク全体を整形しないようにする。
+
+    Args:
+        title: ログの見出し。
+        results: 検索結果のリスト。
+
+    Returns:
+        list[str]: ログ行のリスト。
+    """
+    if not results:
+        return [title, '  見つかりませんでした']
+    lines = [title]
+    for i, doc in enumerate(results, 1):
+        score = float(doc.get('score', 0.0))
+        preview = doc.get('content', '')[:_LOG_PREVIEW_CHARS]
+        lines.append(f'  [{i}] {doc.get("path", "")} [score={score:.3f}]')
+        lines.append(f'     {preview}...')
+    return lines
+
+
+def _index_mtime_ns(path: Path) -> int:
+    """インデックスファイルの更新時刻を返す(存在しない場合は0)。
+
+    Args:
+        path: インデックスファイルのパス。
+
+    Returns:
+        更新時刻(ナノ秒)。
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_resource(max_entries=_MAX_CACHED_INDEXES, show_spinner=False)
+def _load_faiss_index(
+    index_dir: Path,
+    index_mtime_ns: int,  # noqa: ARG001 キャッシュキーとしてのみ使用
+    _embeddings: Embeddings,
+) -> FAISS:
+    """FAISSインデックスを読み込む。
+
+    更新時刻をキーに含めるため、インデックスの再構築後は自動的に読み直される。
+
+    Args:
+        index_dir: インデックスディレクトリ。
+        index_mtime_ns: インデックスファイルの更新時刻。
+        _embeddings: 埋め込みモデル(キャッシュキーには含めない)。
+
+    Returns:
+        読み込んだFAISSベクトルストア。
+    """
+    return FAISS.load_local(str(index_dir), _embeddings, allow_dangerous_deserialization=True)
+
+
+def _safe_load_pickle(path: Path) -> BM25Okapi | list[dict[str, Any]] | None:
+    """pickleを安全に読み込む(失敗時はNone)。
+
+    Args:
+        path: 読み込むファイルパス。
+
+    Returns:
+        読み込んだオブジェクト。失敗時はNone。
+    """
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)  # noqa: S301
+    except Exception as e:
+        logger.error('pickle読込エラー: %s (%s)', path, e)
+        return None
+
+
+@st.cache_resource(max_entries=_MAX_CACHED_INDEXES, show_spinner=False)
+def _load_bm25_files(
+    index_dir: Path,
+    index_mtime_ns: int,  # noqa: ARG001 キャッシュキーとしてのみ使用
+) -> tuple[BM25Okapi | None, list[dict[str, Any]] | None]:
+    """BM25インデックスとメタデータを読み込む。
+
+    更新時刻をキーに含めるため、インデックスの再構築後は自動的に読み直される。
+
+    Args:
+        index_dir: インデックスディレクトリ。
+        index_mtime_ns: インデックスファイルの更新時刻。
+
+    Returns:
+        (BM25インデックス, メタデータ)のタプル。
+    """
+    bm25 = _safe_load_pickle(index_dir / 'bm25_index.pkl')
+    metadata = _safe_load_pickle(index_dir / 'metadata.pkl')
+    return bm25, metadata
+
 
 class RAGChatPage:
     """RAGチャットページのUIを管理するクラス。"""
 
-    def __init__(self, project_service: ProjectService, project_repo: JsonProjectRepository):
+    def __init__(self, project_service: ProjectService, project_repo: ProjectRepositoryProtocol):
         """RAGチャットページを初期化する。
 
         Args:
@@ -44,12 +147,9 @@ class RAGChatPage:
 
     def _initialize_session_state(self) -> None:
         """セッション状態を初期化する。"""
-        if 'selected_project_id' not in st.session_state:
-            st.session_state.selected_project_id = None
-        if 'chat_messages' not in st.session_state:
-            st.session_state.chat_messages = []
-        if 'rag_logs' not in st.session_state:
-            st.session_state.rag_logs = []
+        st.session_state.setdefault('selected_project_id', None)
+        st.session_state.setdefault('chat_messages', [])
+        st.session_state.setdefault('rag_logs', [])
 
     def render(self) -> None:
         """RAGチャットページをレンダリングする。"""
@@ -190,7 +290,7 @@ class RAGChatPage:
         Args:
             error: エラー。
         """
-        logger.error(f'インデックス再構築エラー: {error}')
+        logger.error('インデックス再構築エラー: %s', error)
         self._add_log(f'インデックス再構築エラー: {error!s}')
         st.error(f'インデックス再構築エラー: {error!s}')
 
@@ -250,7 +350,7 @@ class RAGChatPage:
             st.rerun()
 
         except Exception as e:
-            logger.error(f'RAG処理エラー: {e}')
+            logger.error('RAG処理エラー: %s', e)
             self._add_log(f'RAG処理エラー: {e!s}')
             st.session_state.chat_messages.append(
                 {'role': 'assistant', 'content': 'エラーが発生しました。'}
@@ -305,7 +405,7 @@ class RAGChatPage:
             index_dir = source_dir / 'vector_db'
 
             if not index_dir.exists():
-                logger.warning(f'セマンティックインデックスが存在しません: {index_dir}')
+                logger.warning('セマンティックインデックスが存在しません: %s', index_dir)
             else:
                 # 埋め込みモデルの取得
                 embeddings = self._get_embeddings_model()
@@ -313,7 +413,7 @@ class RAGChatPage:
                     # FAISSインデックスの読み込みと検索
                     results = self._search_faiss_index(index_dir, embeddings, query)
         except Exception as e:
-            logger.error(f'セマンティックサーチエラー: {e}')
+            logger.error('セマンティックサーチエラー: %s', e)
         return results
 
     def _log_search_counts(self, sem_n: int, kw_n: int, merged_n: int) -> None:
@@ -322,42 +422,15 @@ class RAGChatPage:
 
     def _log_semantic_results(self, semantic_results: list[dict[str, Any]]) -> None:
         """セマンティック検索結果のログを出力する。"""
-        self._add_log('【セマンティック検索結果】')
-        if not semantic_results:
-            self._add_log('  見つかりませんでした')
-            return
-        for i, doc in enumerate(semantic_results, 1):
-            path = doc.get('path', '')
-            score = float(doc.get('score', 0.0))
-            preview = doc.get('content', '')
-            self._add_log(f'  [{i}] {path} [score={score:.3f}]')
-            self._add_log(f'     {preview}...')
+        self._add_log(*_format_result_lines('【セマンティック検索結果】', semantic_results))
 
     def _log_keyword_results(self, keyword_results: list[dict[str, Any]]) -> None:
         """キーワード検索結果のログを出力する。"""
-        self._add_log('【キーワード検索結果】')
-        if not keyword_results:
-            self._add_log('  見つかりませんでした')
-            return
-        for i, doc in enumerate(keyword_results, 1):
-            path = doc.get('path', '')
-            score = float(doc.get('score', 0.0))
-            preview = doc.get('content', '')
-            self._add_log(f'  [{i}] {path} [score={score:.3f}]')
-            self._add_log(f'     {preview}...')
+        self._add_log(*_format_result_lines('【キーワード検索結果】', keyword_results))
 
     def _log_combined_results(self, combined_context: list[dict[str, Any]]) -> None:
         """統合後の検索結果のログを出力する。"""
-        self._add_log('【統合後の検索結果】')
-        if not combined_context:
-            self._add_log('  見つかりませんでした')
-            return
-        for i, doc in enumerate(combined_context, 1):
-            path = doc.get('path', '')
-            score = float(doc.get('score', 0.0))
-            preview = doc.get('content', '')
-            self._add_log(f'  [{i}] {path} [score={score:.3f}]')
-            self._add_log(f'     {preview}...')
+        self._add_log(*_format_result_lines('【統合後の検索結果】', combined_context))
 
     def _get_embeddings_model(self) -> Embeddings | None:
         """埋め込みモデルを取得する。
@@ -384,10 +457,9 @@ class RAGChatPage:
         Returns:
             検索結果のリスト。
         """
-        # FAISSインデックスの読み込み
-        vectorstore = FAISS.load_local(
-            str(index_dir), embeddings, allow_dangerous_deserialization=True
-        )
+        # FAISSインデックスの読み込み（更新されていなければキャッシュを再利用）
+        index_mtime_ns = _index_mtime_ns(index_dir / 'index.faiss')
+        vectorstore = _load_faiss_index(index_dir, index_mtime_ns, embeddings)
 
         # 類似検索の実行（スコア付き）
         docs_with_scores = vectorstore.similarity_search_with_score(query, k=5)
@@ -422,7 +494,7 @@ class RAGChatPage:
             index_dir = source_dir / 'keyword_db'
 
             if not index_dir.exists():
-                logger.warning(f'キーワードインデックスが存在しません: {index_dir}')
+                logger.warning('キーワードインデックスが存在しません: %s', index_dir)
             else:
                 # BM25インデックスの読み込み
                 bm25, metadata = self._load_bm25_index(index_dir)
@@ -430,7 +502,7 @@ class RAGChatPage:
                     # クエリのトークン化と検索実行
                     results = self._search_bm25_index(bm25, metadata, query)
         except Exception as e:
-            logger.error(f'キーワードサーチエラー: {e}')
+            logger.error('キーワードサーチエラー: %s', e)
         return results
 
     def _load_bm25_index(
@@ -448,28 +520,11 @@ class RAGChatPage:
         metadata_path = index_dir / 'metadata.pkl'
 
         if not index_path.exists() or not metadata_path.exists():
-            logger.warning(f'BM25インデックスファイルが存在しません: {index_dir}')
+            logger.warning('BM25インデックスファイルが存在しません: %s', index_dir)
             return None, None
 
-        bm25 = self._safe_load_pickle(index_path)
-        metadata = self._safe_load_pickle(metadata_path)
-        return bm25, metadata
-
-    def _safe_load_pickle(self, path: Path) -> BM25Okapi | list[dict[str, Any]] | None:
-        """pickleを安全に読み込む(失敗時はNone)。
-
-        Args:
-            path: 読み込むファイルパス。
-
-        Returns:
-            読み込んだオブジェクト。失敗時はNone。
-        """
-        try:
-            with open(path, 'rb') as f:
-                return pickle.load(f)  # noqa: S301
-        except Exception as e:
-            logger.error(f'pickle読込エラー: {path} ({e})')
-            return None
+        # 更新されていなければキャッシュ済みのインデックスを再利用
+        return _load_bm25_files(index_dir, _index_mtime_ns(index_path))
 
     def _search_bm25_index(
         self, bm25: BM25Okapi, metadata: list[dict[str, Any]], query: str
@@ -610,7 +665,7 @@ class RAGChatPage:
             return self._await_llm(llm_client, prompt)
 
         except Exception as e:
-            logger.error(f'LLM呼び出しエラー: {e}')
+            logger.error('LLM呼び出しエラー: %s', e)
             return f'LLM呼び出しエラー: {e!s}'
 
     def _await_llm(self, llm_client: LLMClient, prompt: str) -> str:
@@ -663,9 +718,15 @@ class RAGChatPage:
 
 回答:"""
 
-    def _add_log(self, message: str) -> None:
-        """テキストログを追記する。"""
-        st.session_state.rag_logs.append(message)
+    def _add_log(self, *messages: str) -> None:
+        """テキストログを追記する。
+
+        複数行をまとめて渡した場合も、表示の更新は1回だけ行う。
+
+        Args:
+            *messages: 追記するログ行。
+        """
+        st.session_state.rag_logs.extend(messages)
         # 逐次反映
         if 'rag_log_placeholder' in st.session_state:
             log_text = '\n'.join(st.session_state.rag_logs)
@@ -673,7 +734,7 @@ class RAGChatPage:
 
 
 def render_rag_chat_page(
-    project_service: ProjectService, project_repo: JsonProjectRepository
+    project_service: ProjectService, project_repo: ProjectRepositoryProtocol
 ) -> None:
     """RAGチャットページをレンダリングする。
 
@@ -0,0 +1,144 @@
+"""Streamlitのリラン間で共有するリソースを提供するモジュール。"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import streamlit as st
+
+from app.config import get_config
+from app.models.project import Project
+from app.repositories.project_repository import JsonProjectRepository, ProjectRepositoryProtocol
+from app.repositories.sqlite_project_repository import SqliteProjectRepository
+from app.services.project_service import ProjectService
+
+# プロジェクトを同時に実行できる最大数
+_MAX_EXECUTION_WORKERS = 4
+
+# リラン間で保持するプロジェクト一覧の最大数
+_MAX_CACHED_PROJECT_LISTS = 4
+
+# リラン間で保持する対象ディレクトリ一覧の最大数
+_MAX_CACHED_SOURCE_DIR_LISTS = 4
+
+
+@st.cache_resource
+def get_project_repository(data_dir: Path) -> ProjectRepositoryProtocol:
+    """プロセス内で共有するプロジェクトリポジトリを取得する。
+
+    保存形式は設定の `PROJECT_STORE` で切り替える(`sqlite` 以外はJSONファイル)。
+
+    Args:
+        data_dir: データディレクトリのパス。
+
+    Returns:
+        ProjectRepositoryProtocol: キャッシュされたリポジトリ。
+    """
+    if get_config().project_store == 'sqlite':
+        return SqliteProjectRepository(data_dir)
+    return JsonProjectRepository(data_dir)
+
+
+@st.cache_resource
+def get_project_service(data_dir: Path) -> ProjectService:
+    """プロセス内で共有するプロジェクトサービスを取得する。
+
+    Args:
+        data_dir: データディレクトリのパス。
+
+    Returns:
+        ProjectService: キャッシュされたサービス。
+    """
+    return ProjectService(get_project_repository(data_dir))
+
+
+@st.cache_resource
+def get_execution_executor() -> ThreadPoolExecutor:
+    """プロジェクト実行用のスレッドプールを取得する。
+
+    実行はLLM呼び出し待ちが中心のため、スクリプトスレッドをブロックしないよう
+    プロセス内で共有するスレッドプールで行う。
+
+    Returns:
+        ThreadPoolExecutor: キャッシュされたスレッドプール。
+    """
+    return ThreadPoolExecutor(
+        max_workers=_MAX_EXECUTION_WORKERS, thread_name_prefix='aiman-execution'
+    )
+
+
+@st.cache_data(max_entries=_MAX_CACHED_PROJECT_LISTS, show_spinner=False)
+def _load_projects(
+    data_dir: Path,
+    data_version: int,  # noqa: ARG001 キャッシュキーとしてのみ使用
+) -> list[Project]:
+    """指定した保存内容のバージョンに対応するプロジェクト一覧を読み込む。
+
+    Args:
+        data_dir: データディレクトリのパス。
+        data_version: 保存先の更新を検知するための値。
+
+    Returns:
+        list[Project]: プロジェクトのリスト。
+    """
+    return get_project_repository(data_dir).find_all()
+
+
+def load_projects(data_dir: Path) -> list[Project]:
+    """プロジェクト一覧を読み込む。
+
+    保存先が更新されていなければ、リラン間でキャッシュした一覧を返す。
+    更新はリポジトリの `data_version()` で検知するため、明示的な無効化は不要。
+
+    Args:
+        data_dir: データディレクトリのパス。
+
+    Returns:
+        list[Project]: プロジェクトのリスト。
+    """
+    repository = get_project_repository(data_dir)
+    return _load_projects(data_dir, repository.data_version())
+
+
+@st.cache_data(max_entries=_MAX_CACHED_SOURCE_DIR_LISTS, show_spinner=False)
+def _load_source_dirs(
+    projects_root: Path,
+    mtime_ns: int,  # noqa: ARG001 キャッシュキーとしてのみ使用
+) -> list[str]:
+    """指定した更新時刻に対応するサブディレクトリ名の一覧を読み込む。
+
+    Args:
+        projects_root: プロジェクトの対象ディレクトリを置くディレクトリのパス。
+        mtime_ns: `projects_root` の更新時刻(ナノ秒)。
+
+    Returns:
+        list[str]: サブディレクトリ名のリスト。
+    """
+    return [p.name for p in projects_root.iterdir() if p.is_dir()]
+
+
+def load_source_dirs(projects_root: Path) -> list[str]:
+    """プロジェクトの対象として選択できるサブディレクトリ名の一覧を読み込む。
+
+    エントリの追加・削除・名前変更でディレクトリの更新時刻が変わるため、
+    更新時刻が同じ間はリラン間でキャッシュした一覧を返す。
+
+    Args:
+        projects_root: プロジェクトの対象ディレクトリを置くディレクトリのパス。
+
+    Returns:
+        list[str]: サブディレクトリ名のリスト。ディレクトリがない場合は空のリスト。
+    """
+    try:
+        mtime_ns = projects_root.stat().st_mtime_ns
+    except OSError:
+        return []
+    return _load_source_dirs(projects_root, mtime_ns)
+
+
+__all__ = [
+    'get_execution_executor',
+    'get_project_repository',
+    'get_project_service',
+    'load_projects',
+    'load_source_dirs',
+]
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from contextlib import suppress
 from pathlib import Path
 
@@ -71,15 +73,7 @@ class BaseIndexBuilder(ABC):
             収集されたドキュメントのリスト。
         """
         collected: list[Document] = []
-
-        def _should_include(p: Path) -> bool:
-            return (
-                p.is_file()
-                and (p.suffix in self.target_exts)
-                and (self._get_index_db_name() not in p.parts)
-            )
-
-        for path in filter(_should_include, source_dir.rglob('*')):
+        for path in self._iter_source_files(source_dir):
             text = self._read_text(path)
             if not text:
                 continue
@@ -87,6 +81,25 @@ class BaseIndexBuilder(ABC):
             collected.append(Document(page_content=text, metadata={'path': rel}))
         return collected
 
+    def _iter_source_files(self, source_dir: Path) -> Iterator[Path]:
+        """対象ディレクトリからインデックス対象のファイルを逐次列挙する。
+
+        インデックス出力ディレクトリ配下は走査せずに枝刈りする。
+
+        Args:
+            source_dir: ソースディレクトリ。
+
+        Yields:
+            対象拡張子のファイルパス。
+        """
+        index_db_name = self._get_index_db_name()
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            dirnames[:] = [d for d in dirnames if d != index_db_name]
+            base = Path(dirpath)
+            for name in filenames:
+                if os.path.splitext(name)[1] in self.target_exts:
+                    yield base / name
+
     def _split_documents(
         self, docs: list[Document], chunk_size: int = 800, chunk_overlap: int = 100
     ) -> list[Document]:
@@ -1,5 +1,7 @@
 """Embeddingsモデルのファクトリー。"""
 
+from functools import cache
+
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_openai import OpenAIEmbeddings
 from pydantic import SecretStr
@@ -8,11 +10,15 @@ from app.config import config
 from app.types import LLMProviderName
 
 
+@cache
 def get_embeddings_model(
     provider: LLMProviderName,
 ) -> OpenAIEmbeddings | GoogleGenerativeAIEmbeddings:
     """プロバイダに応じた埋め込みモデルを返す。
 
+    HTTPクライアントの接続プールを再利用するため、プロバイダごとに1つの
+    インスタンスをキャッシュして返す。
+
     Args:
         provider: 埋め込みプロバイダ。
 
@@ -5,11 +5,12 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import fitz  # PyMuPDF
-from docx import Document
-from openpyxl import load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
+from app.utils.file_system import decode_text
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
 
 logger = logging.getLogger('aiman')
 
@@ -40,32 +41,37 @@ def read_text(path: Path) -> str:
 
 def _read_plain_text(path: Path) -> str:
     try:
-        with open(path, encoding='utf-8') as f:
-            return f.read()
+        with open(path, 'rb') as f:
+            return decode_text(f.read())
     except Exception as e:
-        logger.warning(f'テキスト読込失敗: {path} ({e})')
+        logger.warning('テキスト読込失敗: %s (%s)', path, e)
         return ''
 
 
 def _read_pdf_text(path: Path) -> str:
     try:
+        # 重いライブラリは該当形式のファイルを処理するときに初めて読み込む
+        import fitz  # noqa: PLC0415  # PyMuPDF
+
         text_parts: list[str] = []
         with fitz.open(str(path)) as doc:
             for page in doc:
                 text_parts.append(page.get_text())
         return '\n'.join(tp for tp in text_parts if tp)
     except Exception as e:
-        logger.warning(f'PDF抽出失敗: {path} ({e})')
+        logger.warning('PDF抽出失敗: %s (%s)', path, e)
         return ''
 
 
 def _read_docx_text(path: Path) -> str:
     try:
+        from docx import Document  # noqa: PLC0415
+
         doc = Document(str(path))
         paragraphs = [p.text for p in doc.paragraphs if p.text]
         return '\n'.join(paragraphs)
     except Exception as e:
-        logger.warning(f'DOCX抽出失敗: {path} ({e})')
+        logger.warning('DOCX抽出失敗: %s (%s)', path, e)
         return ''
 
 
@@ -74,11 +80,13 @@ def _read_xlsx_text(path: Path) -> str:
         parts = _collect_xlsx_parts(path)
         return '\n'.join(parts)
     except Exception as e:
-        logger.warning(f'XLSX抽出失敗: {path} ({e})')
+        logger.warning('XLSX抽出失敗: %s (%s)', path, e)
         return ''
 
 
 def _collect_xlsx_parts(path: Path) -> list[str]:
+    from openpyxl import load_workbook  # noqa: PLC0415
+
     wb = load_workbook(filename=str(path), read_only=True, data_only=True)
     parts: list[str] = []
     for ws in wb.worksheets:
@@ -7,6 +7,24 @@ from typing import Protocol
 logger = logging.getLogger('aiman')
 
 
+def decode_text(data: bytes, encoding: str = 'utf-8') -> str:
+    """ファイル全体のバイト列をテキストに変換する。
+
+    テキストモードでの読み込みと同様に、改行コードをLFに揃える。
+
+    Args:
+        data: ファイルの内容。
+        encoding: エンコーディング。
+
+    Returns:
+        デコードしたテキスト。
+    """
+    text = data.decode(encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 class FileSystemProtocol(Protocol):
     """ファイルシステム操作のプロトコル。"""
 
@@ -105,8 +123,10 @@ class RealFileSystem:
             FileNotFoundError: ファイルが見つからない場合。
             OSError: ファイル読み込みに失敗した場合。
         """
-        with open(path, encoding=encoding) as f:
-            return f.read()
+        # 一括で読み込むため、テキストラッパーを介さずにバイト列をデコードする
+        with open(path, 'rb') as f:
+            data = f.read()
+        return decode_text(data, encoding)
 
     def write_file(
         self, path: Path, content: str, encoding: str = 'utf-8', create_dirs: bool = True
@@ -124,8 +144,9 @@ class RealFileSystem:
         """
         if create_dirs:
             path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w', encoding=encoding) as f:
-            f.write(content)
+        # 一括でエンコードしてバイナリで書き込み、テキストI/O層を経由しない
+        with open(path, 'wb') as f:
+            f.write(content.encode(encoding))
 
     def list_files(self, path: Path, pattern: str = '*') -> list[Path]:
         """ディレクトリ内のファイルを再帰的に取得する。
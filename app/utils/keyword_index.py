@@ -41,12 +41,14 @@ class KeywordIndexBuilder(BaseIndexBuilder):
             index_dir: 出力するBM25インデックスディレクトリ(常に上書き)。
         """
         if not source_dir.exists() or not source_dir.is_dir():
-            logger.warning(f'キーワードインデックス生成をスキップ: 無効なディレクトリ {source_dir}')
+            logger.warning(
+                'キーワードインデックス生成をスキップ: 無効なディレクトリ %s', source_dir
+            )
             return
 
         docs = self._collect_documents(source_dir)
         if not docs:
-            logger.info(f'キーワードインデックス対象なし: {source_dir}')
+            logger.info('キーワードインデックス対象なし: %s', source_dir)
             self._ensure_clean_dir(index_dir)
             return
 
@@ -90,7 +92,7 @@ class KeywordIndexBuilder(BaseIndexBuilder):
         with open(metadata_path, 'wb') as f:
             pickle.dump(metadata, f)
 
-        logger.info(f'BM25インデックスを保存: {index_dir} ({len(chunks)}個のチャンク)')
+        logger.info('BM25インデックスを保存: %s (%d個のチャンク)', index_dir, len(chunks))
 
 
 def build_keyword_index(source_dir: Path, index_dir: Path) -> None:
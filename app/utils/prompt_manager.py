@@ -2,6 +2,28 @@
 
 from abc import ABC, abstractmethod
 
+# OVERVIEWプロンプト末尾の固定の指示文
+_OVERVIEW_INSTRUCTION = """
+
+以下の形式で回答してください:
+
+## 概要
+[ディレクトリの全体像を簡潔に説明]
+
+## 主要な内容
+[重要なファイルやディレクトリの説明]
+
+## 主要な論点
+[分析から得られた主要な論点や特徴]
+
+## アクション項目
+[今後の作業や検討が必要な項目]
+
+## 技術的な特徴
+[使用されている技術やフレームワーク等]
+
+日本語で回答してください。"""
+
 
 class PromptTemplate(ABC):
     """プロンプトテンプレートの抽象基底クラス。"""
@@ -45,11 +67,13 @@ class OverviewPromptTemplate(PromptTemplate):
         if not isinstance(file_contents, dict):
             file_contents = {}
 
-        prompt = self._build_base_prompt(directory_path, file_list)
-        prompt += self._build_file_contents_section(file_contents)
-        prompt += self._build_instruction_section()
-
-        return prompt
+        return ''.join(
+            (
+                self._build_base_prompt(directory_path, file_list),
+                self._build_file_contents_section(file_contents),
+                self._build_instruction_section(),
+            )
+        )
 
     def _build_base_prompt(self, directory_path: str, file_list: list[str]) -> str:
         """基本プロンプトを構築する。"""
@@ -67,33 +91,15 @@ class OverviewPromptTemplate(PromptTemplate):
         if not file_contents:
             return ''
 
-        section = 'ファイル内容:\n'
-        for file_path, content in file_contents.items():
-            section += f'\n--- {file_path} ---\n{content[:1000]}...\n'
-        return section
+        sections = (
+            f'\n--- {file_path} ---\n{content[:1000]}...\n'
+            for file_path, content in file_contents.items()
+        )
+        return 'ファイル内容:\n' + ''.join(sections)
 
     def _build_instruction_section(self) -> str:
         """指示セクションを構築する。"""
-        return """
-
-以下の形式で回答してください:
-
-## 概要
-[ディレクトリの全体像を簡潔に説明]
-
-## 主要な内容
-[重要なファイルやディレクトリの説明]
-
-## 主要な論点
-[分析から得られた主要な論点や特徴]
-
-## アクション項目
-[今後の作業や検討が必要な項目]
-
-## 技術的な特徴
-[使用されている技術やフレームワーク等]
-
-日本語で回答してください。"""
+        return _OVERVIEW_INSTRUCTION
 
     def _format_file_list(self, file_list: list[str]) -> str:
         """ファイル一覧をフォーマットする。
@@ -107,11 +113,7 @@ class OverviewPromptTemplate(PromptTemplate):
         if not file_list:
             return 'ファイルが見つかりませんでした。'
 
-        formatted_list = []
-        for file_path in file_list:
-            formatted_list.append(f'- {file_path}')
-
-        return '\n'.join(formatted_list)
+        return '\n'.join(f'- {file_path}' for file_path in file_list)
 
 
 class ReviewPromptTemplate(PromptTemplate):
@@ -46,12 +46,12 @@ class SemanticIndexBuilder(BaseIndexBuilder):
             index_dir: 出力するFAISSディレクトリ(常に上書き)。
         """
         if not source_dir.exists() or not source_dir.is_dir():
-            logger.warning(f'インデックス生成をスキップ: 無効なディレクトリ {source_dir}')
+            logger.warning('インデックス生成をスキップ: 無効なディレクトリ %s', source_dir)
             return
 
         docs = self._collect_documents(source_dir)
         if not docs:
-            logger.info(f'インデックス対象なし: {source_dir}')
+            logger.info('インデックス対象なし: %s', source_dir)
             self._ensure_clean_dir(index_dir)
             return
 
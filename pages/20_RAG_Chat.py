@@ -20,18 +20,17 @@ def render_rag_chat() -> None:
 
     from app.config import config  # noqa: PLC0415
     from app.logger import setup_logging  # noqa: PLC0415
-    from app.repositories.project_repository import JsonProjectRepository  # noqa: PLC0415
-    from app.services.project_service import ProjectService  # noqa: PLC0415
     from app.ui.rag_chat_page import render_rag_chat_page  # noqa: PLC0415
+    from app.ui.resources import get_project_repository, get_project_service  # noqa: PLC0415
 
     # ログ初期化（多重初期化はsetup側で抑止されている想定）
     setup_logging()
     logger = logging.getLogger('aiman')
-    logger.info(f'RAG page loaded. ENV={os.environ.get("ENV")} LOG_LEVEL={config.LOG_LEVEL}')
+    logger.info('RAG page loaded. ENV=%s LOG_LEVEL=%s', os.environ.get('ENV'), config.LOG_LEVEL)
 
-    # リポジトリとサービスの初期化
-    project_repo = JsonProjectRepository(config.data_dir_path)
-    project_service = ProjectService(project_repo)
+    # リポジトリとサービスの取得（リラン間でキャッシュ共有）
+    project_repo = get_project_repository(config.data_dir_path)
+    project_service = get_project_service(config.data_dir_path)
 
     st.set_page_config(page_title='RAG チャット', page_icon='💬', layout='wide')
     render_rag_chat_page(project_service, project_repo)
@@ -2,12 +2,13 @@
 
 import json
 import os
-import stat
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from uuid import UUID
 
 import pytest
+from pytest_mock import MockerFixture
 
 from app.errors import PathIsDirectoryError, ResourceNotFoundError
 from app.models.project import Project
@@ -110,6 +111,23 @@ class TestJsonProjectRepository:
         assert project1.id in project_ids
         assert project2.id in project_ids
 
+    def test_複数スレッドから同時に保存しても更新が失われない(
+        self, repository: JsonProjectRepository
+    ) -> None:
+        # Arrange
+        projects = [
+            Project(name=f'プロジェクト{i}', source=f'/path{i}', tool=ToolType.OVERVIEW)
+            for i in range(20)
+        ]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(repository.save, projects))
+
+        # Assert
+        saved_ids = {p.id for p in repository.find_all()}
+        assert saved_ids == {p.id for p in projects}
+
     def test_プロジェクトを更新できる(
         self, repository: JsonProjectRepository, sample_project: Project
     ) -> None:
@@ -124,6 +142,128 @@ class TestJsonProjectRepository:
         updated_project = repository.find_by_id(sample_project.id)
         assert updated_project.name == '更新されたプロジェクト'
 
+    def test_ファイルが更新されるまで読み込み結果を再利用する(
+        self, repository: JsonProjectRepository, sample_project: Project, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        repository.save(sample_project)
+        read_spy = mocker.spy(repository, '_read_json')
+        projects_file = repository.projects_path
+
+        # Act
+        repository.find_all()
+        repository.find_all()
+        reads_before_update = read_spy.call_count
+        stat = projects_file.stat()
+        os.utime(projects_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        repository.find_all()
+
+        # Assert
+        assert reads_before_update == 0
+        assert read_spy.call_count == 1
+
+    def test_更新時刻が同じでもサイズが変われば読み込み直す(
+        self, repository: JsonProjectRepository, sample_project: Project
+    ) -> None:
+        # Arrange
+        repository.save(sample_project)
+        projects_file = repository.projects_path
+        stat = projects_file.stat()
+        data = json.loads(projects_file.read_text(encoding='utf-8'))
+        data[0]['name'] = '外部で更新されたプロジェクト'
+        projects_file.write_text(json.dumps(data), encoding='utf-8')
+        os.utime(projects_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # Act
+        found = repository.find_by_id(sample_project.id)
+
+        # Assert
+        assert found.name == '外部で更新されたプロジェクト'
+
+    def test_保存した内容は再読み込みせずに取得できる(
+        self, repository: JsonProjectRepository, sample_project: Project, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        repository.find_all()
+        read_spy = mocker.spy(repository, '_read_json')
+
+        # Act
+        repository.save(sample_project)
+        sample_project.start_processing()
+        repository.save(sample_project)
+        projects = repository.find_all()
+
+        # Assert
+        assert read_spy.call_count == 0
+        assert [p.id for p in projects] == [sample_project.id]
+        assert projects[0].executed_at == sample_project.executed_at
+
+    def test_内容が変わらない場合はファイルを書き換えない(
+        self, repository: JsonProjectRepository, sample_project: Project, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        repository.save(sample_project)
+        write_spy = mocker.spy(repository, '_write_json')
+
+        # Act
+        repository.save(repository.find_by_id(sample_project.id))
+        sample_project.start_processing()
+        repository.save(sample_project)
+
+        # Assert
+        assert write_spy.call_count == 1
+        assert repository.find_by_id(sample_project.id).executed_at == sample_project.executed_at
+
+    def test_取得したプロジェクトを変更してもキャッシュに影響しない(
+        self, repository: JsonProjectRepository, sample_project: Project
+    ) -> None:
+        # Arrange
+        repository.save(sample_project)
+
+        # Act
+        repository.find_all()[0].name = '変更後'
+
+        # Assert
+        assert repository.find_by_id(sample_project.id).name == sample_project.name
+
+    def test_取得したプロジェクトの結果を変更してもキャッシュに影響しない(
+        self, repository: JsonProjectRepository, sample_project: Project
+    ) -> None:
+        # Arrange
+        sample_project.complete({'message': '完了'})
+        repository.save(sample_project)
+
+        # Act
+        found = repository.find_by_id(sample_project.id)
+        assert found.result is not None
+        found.result['message'] = '変更後'
+        listed = repository.find_all()[0]
+        assert listed.result is not None
+        listed.result['extra'] = '追加'
+
+        # Assert
+        assert repository.find_by_id(sample_project.id).result == {'message': '完了'}
+
+    def test_保存時は対象以外のレコードを再シリアライズしない(
+        self, repository: JsonProjectRepository, sample_project: Project
+    ) -> None:
+        # Arrange
+        other = Project(name='他のプロジェクト', source='/other', tool=ToolType.REVIEW)
+        repository.save(other)
+        projects_file = repository.data_dir / 'projects.json'
+        data = json.loads(projects_file.read_text(encoding='utf-8'))
+        data[0]['legacy_field'] = 'keep'
+        projects_file.write_text(json.dumps(data), encoding='utf-8')
+        os.utime(projects_file, ns=(0, 1))
+
+        # Act
+        repository.save(sample_project)
+
+        # Assert
+        saved = json.loads(projects_file.read_text(encoding='utf-8'))
+        assert saved[0]['legacy_field'] == 'keep'
+        assert [p['name'] for p in saved] == ['他のプロジェクト', sample_project.name]
+
     def test_空のファイルから開始できる(self, repository: JsonProjectRepository) -> None:
         # Act
         projects = repository.find_all()
@@ -145,6 +285,17 @@ class TestJsonProjectRepository:
         assert len(data) == 1
         assert data[0]['name'] == sample_project.name
 
+    def test_JSONファイルはインデントせず改行で終わる(
+        self, repository: JsonProjectRepository, sample_project: Project
+    ) -> None:
+        # Act
+        repository.save(sample_project)
+
+        # Assert
+        content = repository.projects_path.read_bytes()
+        assert content.endswith(b']\n')
+        assert content.count(b'\n') == 1
+
     def test_JSONファイル読み込みエラー時に空リストを返す(
         self, repository: JsonProjectRepository, temp_dir: Path
     ) -> None:
@@ -160,16 +311,49 @@ class TestJsonProjectRepository:
         assert len(projects) == 0
 
     def test_保存時にエラーが発生しても例外を再送出する(
-        self, repository: JsonProjectRepository, sample_project: Project, temp_dir: Path
+        self, repository: JsonProjectRepository, sample_project: Project, mocker: MockerFixture
     ) -> None:
         # Arrange
-        projects_file = temp_dir / 'projects.json'
-        # ファイルを読み取り専用にして書き込みエラーを発生させる
-        os.chmod(projects_file, stat.S_IREAD)
+        # ファイルの置き換えで書き込みエラーを発生させる
+        mocker.patch(
+            'app.repositories.project_repository.os.replace',
+            side_effect=PermissionError(13, 'Permission denied'),
+        )
 
         # Act & Assert
         with pytest.raises(OSError, match='Permission denied'):
             repository.save(sample_project)
+        assert list(repository.data_dir.iterdir()) == [repository.projects_path]
+
+    def test_置き換え後に親ディレクトリを同期する(
+        self, repository: JsonProjectRepository, sample_project: Project, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        fsync_spy = mocker.spy(os, 'fsync')
+
+        # Act
+        repository.save(sample_project)
+
+        # Assert
+        assert fsync_spy.call_count == 2
+
+    def test_書き込みが中断されても既存のファイルは壊れない(
+        self, repository: JsonProjectRepository, sample_project: Project, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        repository.save(sample_project)
+        original = repository.projects_path.read_bytes()
+        mocker.patch('app.repositories.project_repository.os.fsync', side_effect=OSError('disk'))
+        sample_project.name = '更新されたプロジェクト'
+
+        # Act
+        with pytest.raises(OSError, match='disk'):
+            repository.save(sample_project)
+
+        # Assert
+        assert repository.projects_path.read_bytes() == original
+        assert list(repository.data_dir.iterdir()) == [repository.projects_path]
+        assert repository.find_by_id(sample_project.id).name == 'テストプロジェクト'
 
     def test_データディレクトリがファイルとして存在する場合にファイル移動処理が実行される(
         self, temp_dir: Path
@@ -0,0 +1,202 @@
+"""SQLiteプロジェクトリポジトリのテスト。"""
+
+import sqlite3
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.errors import DataManagerError, ResourceNotFoundError
+from app.models.project import Project
+from app.repositories.project_repository import JsonProjectRepository
+from app.repositories.sqlite_project_repository import SqliteProjectRepository
+from app.types import ProjectID, ToolType
+
+
+class TestSqliteProjectRepository:
+    """SqliteProjectRepositoryのテストクラス。"""
+
+    @pytest.fixture
+    def repository(self, tmp_path: Path) -> Generator[SqliteProjectRepository, None, None]:
+        """リポジトリを作成する。"""
+        repository = SqliteProjectRepository(tmp_path)
+        yield repository
+        repository.close()
+
+    @pytest.fixture
+    def sample_project(self) -> Project:
+        """サンプルプロジェクトを作成する。"""
+        return Project(name='テストプロジェクト', source='/path/to/source', tool=ToolType.OVERVIEW)
+
+    def test_保存したプロジェクトをIDで取得できる(
+        self, repository: SqliteProjectRepository, sample_project: Project
+    ) -> None:
+        # Act
+        repository.save(sample_project)
+
+        # Assert
+        found = repository.find_by_id(sample_project.id)
+        assert found == sample_project
+
+    def test_存在しないIDでプロジェクトを取得するとResourceNotFoundErrorが発生する(
+        self, repository: SqliteProjectRepository
+    ) -> None:
+        # Act & Assert
+        with pytest.raises(ResourceNotFoundError):
+            repository.find_by_id(ProjectID(UUID('12345678-1234-5678-1234-567812345678')))
+
+    def test_更新しても登録順が保たれる(self, repository: SqliteProjectRepository) -> None:
+        # Arrange
+        first = Project(name='プロジェクト1', source='/path1', tool=ToolType.OVERVIEW)
+        second = Project(name='プロジェクト2', source='/path2', tool=ToolType.REVIEW)
+        repository.save(first)
+        repository.save(second)
+        first.start_processing()
+
+        # Act
+        repository.save(first)
+
+        # Assert
+        projects = repository.find_all()
+        assert [p.id for p in projects] == [first.id, second.id]
+        assert projects[0].executed_at == first.executed_at
+
+    def test_複数スレッドから同時に保存しても更新が失われない(
+        self, repository: SqliteProjectRepository
+    ) -> None:
+        # Arrange
+        projects = [
+            Project(name=f'プロジェクト{i}', source=f'/path{i}', tool=ToolType.OVERVIEW)
+            for i in range(20)
+        ]
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(repository.save, projects))
+
+        # Assert
+        assert {p.id for p in repository.find_all()} == {p.id for p in projects}
+
+    def test_新規作成時に既存のprojects_jsonを取り込む(
+        self, tmp_path: Path, sample_project: Project
+    ) -> None:
+        # Arrange
+        JsonProjectRepository(tmp_path).save(sample_project)
+
+        # Act
+        repository = SqliteProjectRepository(tmp_path)
+        projects = repository.find_all()
+        repository.close()
+
+        # Assert
+        assert [p.id for p in projects] == [sample_project.id]
+
+    def test_保存するとデータバージョンが変化する(
+        self, repository: SqliteProjectRepository, sample_project: Project
+    ) -> None:
+        # Arrange
+        before = repository.data_version()
+
+        # Act
+        repository.save(sample_project)
+
+        # Assert
+        assert repository.data_version() != before
+
+    def test_取り込みに失敗した場合は次回の初期化で再び取り込む(
+        self, tmp_path: Path, sample_project: Project
+    ) -> None:
+        # Arrange
+        json_path = tmp_path / 'projects.json'
+        json_path.write_text('invalid json', encoding='utf-8')
+        with pytest.raises(DataManagerError):
+            SqliteProjectRepository(tmp_path)
+        JsonProjectRepository(tmp_path).save(sample_project)
+
+        # Act
+        repository = SqliteProjectRepository(tmp_path)
+        projects = repository.find_all()
+        repository.close()
+
+        # Assert
+        assert [p.id for p in projects] == [sample_project.id]
+
+    def test_取り込み済みの場合はprojects_jsonを再び取り込まない(
+        self, tmp_path: Path, sample_project: Project
+    ) -> None:
+        # Arrange
+        SqliteProjectRepository(tmp_path).close()
+        JsonProjectRepository(tmp_path).save(sample_project)
+
+        # Act
+        repository = SqliteProjectRepository(tmp_path)
+        projects = repository.find_all()
+        repository.close()
+
+        # Assert
+        assert projects == []
+
+    def test_データベースのエラーはDataManagerErrorとして送出する(
+        self, repository: SqliteProjectRepository, sample_project: Project, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        conn = mocker.MagicMock()
+        conn.execute.side_effect = sqlite3.OperationalError('database is locked')
+        original_conn, repository._conn = repository._conn, conn
+
+        # Act & Assert
+        try:
+            with pytest.raises(DataManagerError, match='database is locked'):
+                repository.save(sample_project)
+            with pytest.raises(DataManagerError, match='database is locked'):
+                repository.find_all()
+            with pytest.raises(DataManagerError, match='database is locked'):
+                repository.find_by_id(sample_project.id)
+        finally:
+            repository._conn = original_conn
+
+    def test_他の接続による変更でもデータバージョンが変化する(
+        self, repository: SqliteProjectRepository, sample_project: Project
+    ) -> None:
+        # Arrange
+        other = SqliteProjectRepository(repository.data_dir)
+        before = repository.data_version()
+
+        # Act
+        other.save(sample_project)
+        other.close()
+
+        # Assert
+        assert repository.data_version() != before
+        assert [p.id for p in repository.find_all()] == [sample_project.id]
+
+    def test_内容が変わらない保存ではデータバージョンが変化しない(
+        self, repository: SqliteProjectRepository, sample_project: Project
+    ) -> None:
+        # Arrange
+        repository.save(sample_project)
+        before = repository.data_version()
+
+        # Act
+        repository.save(sample_project)
+
+        # Assert
+        assert repository.data_version() == before
+
+    def test_取り込みに失敗した場合は接続を閉じる(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        (tmp_path / 'projects.json').write_text('invalid json', encoding='utf-8')
+        connect_spy = mocker.spy(sqlite3, 'connect')
+
+        # Act
+        with pytest.raises(DataManagerError):
+            SqliteProjectRepository(tmp_path)
+
+        # Assert
+        with pytest.raises(sqlite3.ProgrammingError, match='closed'):
+            connect_spy.spy_return.execute('SELECT 1')
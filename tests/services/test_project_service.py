@@ -10,7 +10,7 @@ from pytest_mock import MockerFixture
 from app.errors import LLMError, ProjectNotFoundError
 from app.models.project import Project
 from app.services.project_service import ProjectService
-from app.types import LLMProviderName, ProjectID, ToolType
+from app.types import LLMProviderName, ProjectID, ProjectStatus, ToolType
 from app.utils.llm_client import LLMClient
 
 
@@ -89,6 +89,20 @@ class TestProjectService:
         # Assert
         assert result is None
 
+    @pytest.mark.parametrize(
+        ('name', 'source'),
+        [('   ', '/path/to/source'), ('名前', '\t\n'), ('　', '/path/to/source')],
+    )
+    def test_空白のみの入力でプロジェクト作成が失敗する(
+        self, project_service: ProjectService, mock_repository: Mock, name: str, source: str
+    ) -> None:
+        # Act
+        result = project_service.create_project(name, source, ToolType.OVERVIEW)
+
+        # Assert
+        assert result is None
+        mock_repository.save.assert_not_called()
+
     def test_内蔵ツールでプロジェクト作成が成功する(
         self, project_service: ProjectService, mock_repository: Mock
     ) -> None:
@@ -115,7 +129,7 @@ class TestProjectService:
         name = 'テストプロジェクト'
         source = '/path/to/source'
         tool = ToolType.OVERVIEW
-        mock_repository.save.side_effect = Exception('データベースエラー')
+        mock_repository.save.side_effect = OSError('データベースエラー')
 
         # Act
         result = project_service.create_project(name, source, tool)
@@ -209,6 +223,23 @@ class TestProjectService:
         assert args[1] == mock_path_instance  # Path(project.source) / 'vector_db'
         assert isinstance(args[2], LLMProviderName)
 
+    def test_インデックス構築でベクタとキーワードの両方が構築される(
+        self, mocker: MockerFixture, project_service: ProjectService, mock_repository: Mock
+    ) -> None:
+        # Arrange
+        project = Project(name='並行構築', source='/path/to/source', tool=ToolType.OVERVIEW)
+        mock_faiss = mocker.patch('app.services.project_service.build_faiss_index')
+        mock_keyword = mocker.patch('app.services.project_service.build_keyword_index')
+
+        # Act
+        project_service.build_project_index(project)
+
+        # Assert
+        mock_faiss.assert_called_once()
+        mock_keyword.assert_called_once()
+        assert project.index_finished_at is not None
+        assert mock_repository.save.call_count == 2
+
     def test_内蔵ツールでプロジェクトを実行できる(
         self,
         project_service: ProjectService,
@@ -235,6 +266,58 @@ class TestProjectService:
         mock_repository.save.assert_called()
         mock_file_system.write_file.assert_called_once()
 
+    def test_実行開始時に処理中状態が永続化される(
+        self,
+        project_service: ProjectService,
+        mock_repository: Mock,
+        mock_llm_client: Mock,
+    ) -> None:
+        # Arrange
+        project = Project(
+            name='テストプロジェクト', source='/path/to/source', tool=ToolType.OVERVIEW
+        )
+        mock_repository.find_by_id.return_value = project
+        saved_statuses: list[ProjectStatus] = []
+        mock_repository.save.side_effect = lambda p: saved_statuses.append(p.status)
+        statuses_at_llm_call: list[ProjectStatus] = []
+
+        def generate_text(_prompt: str) -> str:
+            statuses_at_llm_call.extend(saved_statuses)
+            return 'テスト用のLLM応答'
+
+        mock_llm_client.generate_text.side_effect = generate_text
+
+        # Act
+        result, _ = project_service.execute_project(project.id)
+
+        # Assert
+        assert result is project
+        assert statuses_at_llm_call == [ProjectStatus.PROCESSING]
+        assert saved_statuses[-1] == ProjectStatus.COMPLETED
+
+    def test_入力の不備で失敗した場合は未実行の状態に戻して保存する(
+        self,
+        project_service: ProjectService,
+        mock_repository: Mock,
+        mock_file_system: Mock,
+    ) -> None:
+        # Arrange
+        project = Project(name='レビュー', source='/test/source', tool=ToolType.REVIEW)
+        mock_repository.find_by_id.return_value = project
+        saved_statuses: list[ProjectStatus] = []
+        mock_repository.save.side_effect = lambda p: saved_statuses.append(p.status)
+        mock_file_system.list_files.return_value = []
+
+        # Act
+        result, message = project_service.execute_project(project.id)
+
+        # Assert
+        assert result is None
+        assert message == 'レビュー対象のファイルが見つかりません'
+        assert saved_statuses == [ProjectStatus.PROCESSING, ProjectStatus.PENDING]
+        assert project.executed_at is None
+        assert project.result is None
+
     def test_内蔵ツールOVERVIEWで正しいファイルが生成される(
         self,
         project_service: ProjectService,
@@ -383,6 +466,28 @@ class TestProjectService:
         assert str(output_path).endswith('review.txt')
         assert '# REVIEW result' in content
 
+    def test_REVIEWの対象ファイルは1回の走査で優先順に選ばれる(
+        self,
+        project_service: ProjectService,
+        mock_repository: Mock,
+        mock_file_system: Mock,
+    ) -> None:
+        # Arrange
+        project = Project(name='REVIEW優先順', source='/test/source', tool=ToolType.REVIEW)
+        mock_repository.find_by_id.return_value = project
+        mock_file_system.list_files.return_value = [
+            Path('/test/source/main.py'),
+            Path('/test/source/notes.txt'),
+            Path('/test/source/README.md'),
+        ]
+
+        # Act
+        project_service.execute_project(project.id)
+
+        # Assert
+        mock_file_system.list_files.assert_called_once_with(Path('/test/source'), '*')
+        mock_file_system.read_file.assert_called_once_with(Path('/test/source/README.md'))
+
     def test_内蔵ツール実行時にファイル書き込みエラーが発生した場合(
         self,
         project_service: ProjectService,
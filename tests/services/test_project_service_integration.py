@@ -74,11 +74,11 @@ class TestProjectServiceLLMIntegration:
             mock_parent.mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
             # 結果ファイルの書き込みが呼ばれることを確認（.env.dev の読み込みは除く）
-            mock_open.assert_any_call(mock_output_path, 'w', encoding='utf-8')
+            mock_open.assert_any_call(mock_output_path, 'wb')
             handle = mock_open.return_value.__enter__.return_value
 
             # 実際の出力内容を確認
-            actual_call_args = handle.write.call_args[0][0]
+            actual_call_args = handle.write.call_args[0][0].decode('utf-8')
             assert '# OVERVIEW result' in actual_call_args
             assert 'OpenAI default-model response:' in actual_call_args
             # LLMの応答内容を確認（プロンプト内容ではなく）
@@ -122,7 +122,7 @@ class TestProjectServiceLLMIntegration:
         mock_source_path.rglob.return_value = [mock_python_file]
 
         # ファイル読み込みのモック
-        mocker.patch('builtins.open', mocker.mock_open(read_data='def test_function():\n    pass'))
+        mocker.patch('builtins.open', mocker.mock_open(read_data=b'def test_function():\n    pass'))
 
         # LLMClientのモック
         with patch('app.services.project_service.LLMClient') as mock_llm_client_class:
@@ -2,7 +2,11 @@
 
 from pathlib import Path
 
-from app.config import config
+import pytest
+from pydantic import ValidationError
+
+from app import config as config_module
+from app.config import Config, config, get_config
 
 
 class TestConfig:
@@ -45,3 +49,24 @@ class TestConfig:
         # Act & Assert
         assert config.openai_embedding_model is not None
         assert config.gemini_embedding_model is not None
+
+    def test_設定インスタンスは1度だけ生成され共有される(self) -> None:
+        # Act & Assert
+        assert get_config() is get_config()
+        assert config_module.config is get_config()
+        assert config is get_config()
+
+    def test_パスは初回生成後に再利用される(self) -> None:
+        # Act & Assert
+        assert config.data_dir_path is config.data_dir_path
+        assert config.log_file_path is config.log_file_path
+
+    def test_未知の保存形式は設定の読み込み時に拒否される(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setenv('PROJECT_STORE', 'SQLite')
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            Config()
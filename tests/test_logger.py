@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 from pytest_mock import MockerFixture
 
-from app.logger import setup_logging
+from app.logger import HANDLER_MARKER, setup_logging
 
 
 class TestSetupLogging:
@@ -18,6 +18,10 @@ class TestSetupLogging:
         app_logger = logging.getLogger('aiman')
         if app_logger.hasHandlers():
             app_logger.handlers.clear()
+        root_logger = logging.getLogger()
+        for handler in [h for h in root_logger.handlers if getattr(h, HANDLER_MARKER, False)]:
+            root_logger.removeHandler(handler)
+            handler.close()
 
     def test_ロガーが正しく設定される(self, mocker: MockerFixture) -> None:
         """setup_loggingを初めて呼び出したときに、ロガーが正しく設定されることを確認する。"""
@@ -53,3 +57,5 @@ class TestSetupLogging:
         app_logger = logging.getLogger('aiman')
         assert app_logger.name == 'aiman'
         assert app_logger.level == logging.INFO
+        marked = [h for h in logging.getLogger().handlers if getattr(h, HANDLER_MARKER, False)]
+        assert len(marked) == 2
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import pytest
 from pytest_mock import MockerFixture
 
 from app.ui import main_page
@@ -19,9 +20,9 @@ class TestMainPage:
         mock_config = mocker.MagicMock()
         mock_config.data_dir_path = Path('/test/data')
         mock_get_config.return_value = mock_config
-        mock_logger = mocker.MagicMock()
-        mocker.patch('app.ui.main_page.logging.getLogger', return_value=mock_logger)
-        mocker.patch('app.ui.main_page.JsonProjectRepository')
+        mock_logger = mocker.patch.object(main_page, 'logger')
+        mocker.patch.object(main_page, 'get_project_service')
+        mocker.patch.object(main_page, 'load_projects', return_value=[])
 
         # Act
         main_page.render_main_page()
@@ -29,4 +30,44 @@ class TestMainPage:
         # Assert
         mock_st.title.assert_called_once_with('AI Project Manager')
         mock_setup_logging.assert_called()
-        mock_logger.info.assert_called_once_with('Data directory: /test/data')
+        mock_logger.info.assert_called_once_with('Data directory: %s', Path('/test/data'))
+
+    def test_実行中のプロジェクトがある間だけ一覧を定期更新する(
+        self, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        mock_st = mocker.patch.object(main_page, 'st')
+        mocker.patch.object(main_page, 'setup_logging')
+        mocker.patch.object(main_page, 'get_config')
+        mocker.patch.object(main_page, 'get_project_service')
+        mocker.patch.object(main_page, 'render_project_creation_form')
+        mocker.patch.object(main_page, 'render_project_detail_modal')
+
+        # Act
+        mock_st.session_state = {'running_workers': {}}
+        main_page.render_main_page()
+        mock_st.session_state = {'running_workers': {'id': mocker.MagicMock()}}
+        main_page.render_main_page()
+
+        # Assert
+        run_every = [c.kwargs['run_every'] for c in mock_st.fragment.call_args_list]
+        assert run_every == [None, main_page._AUTO_REFRESH_SECONDS]
+
+    def test_実行中のプロジェクトが完了するとページ全体を再実行する(
+        self, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        mock_st = mocker.patch.object(main_page, 'st')
+        mock_st.session_state = {'running_workers': {'id': mocker.MagicMock()}}
+        mock_st.rerun.side_effect = RuntimeError('rerun')
+        mocker.patch.object(main_page, 'prune_finished_workers', return_value=frozenset())
+        mock_render = mocker.patch.object(main_page, 'render_project_list')
+
+        # Act
+        with pytest.raises(RuntimeError, match='rerun'):
+            main_page._render_project_section(
+                Path('/test/data'), mocker.MagicMock(), mocker.MagicMock()
+            )
+
+        # Assert
+        mock_render.assert_not_called()
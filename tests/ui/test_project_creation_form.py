@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from app.errors import DataManagerError
 from app.models.project import Project
 from app.services.project_service import ProjectService
 from app.types import ToolType
@@ -63,6 +64,22 @@ class TestProjectCreationForm:
         assert is_valid is False
         assert 'プロジェクト名と対象ディレクトリのパスを入力してください' in error_message
 
+    @pytest.mark.parametrize(
+        ('project_name', 'source'),
+        [('   ', '/test/path'), ('テスト', '\t'), (None, '/test/path'), ('テスト', None)],
+    )
+    def test_空白のみや未入力の値は検証が失敗する(
+        self, project_name: str | None, source: str | None
+    ) -> None:
+        # Act
+        is_valid, error_message = project_creation_form._validate_project_inputs(
+            project_name, source, ToolType.OVERVIEW
+        )
+
+        # Assert
+        assert is_valid is False
+        assert error_message == 'プロジェクト名と対象ディレクトリのパスを入力してください。'
+
     def test_内蔵ツールが選択されていない場合の検証が失敗する(self) -> None:
         # Arrange
         project_name = 'テストプロジェクト'
@@ -119,6 +136,46 @@ class TestProjectCreationForm:
         assert success is False
         assert message == 'プロジェクトの作成に失敗しました。'
 
+    def test_プロジェクト作成で入出力エラーが発生した場合(self, mock_project_service: Mock) -> None:
+        # Arrange
+        project = Project(
+            name='テストプロジェクト',
+            source='/test/path',
+            tool=ToolType.OVERVIEW,
+        )
+
+        mock_project_service.create_project.side_effect = OSError('書き込み失敗')
+
+        # Act
+        success, message = project_creation_form._create_project_with_validation(
+            project, mock_project_service
+        )
+
+        # Assert
+        assert success is False
+        assert message == 'プロジェクトの作成に失敗しました。'
+
+    def test_プロジェクト作成でデータ管理エラーが発生した場合(
+        self, mock_project_service: Mock
+    ) -> None:
+        # Arrange
+        project = Project(
+            name='テストプロジェクト',
+            source='/test/path',
+            tool=ToolType.OVERVIEW,
+        )
+
+        mock_project_service.create_project.side_effect = DataManagerError('database is locked')
+
+        # Act
+        success, message = project_creation_form._create_project_with_validation(
+            project, mock_project_service
+        )
+
+        # Assert
+        assert success is False
+        assert message == 'プロジェクトの作成に失敗しました。'
+
     def test_ProjectFormInputsが正しく作成される(self) -> None:
         # Arrange
         project_name = 'テストプロジェクト'
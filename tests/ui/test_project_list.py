@@ -1,5 +1,6 @@
 """プロジェクト一覧のテスト。"""
 
+from concurrent.futures import Future
 from datetime import datetime
 from unittest.mock import Mock
 from uuid import uuid4
@@ -58,6 +59,16 @@ class TestProjectList:
             tool=ToolType.OVERVIEW,
         )
 
+    def test_日時が一覧表示用に整形される(self) -> None:
+        # Arrange
+        value = datetime(2025, 1, 1, 12, 0, tzinfo=ZoneInfo('Asia/Tokyo'))
+
+        # Act
+        formatted = [project_list._format_datetime(v) for v in (value, None)]
+
+        # Assert
+        assert formatted == ['2025/01/01 12:00', '']
+
     def test_PENDING状態のプロジェクトのアイコンが正しく取得される(
         self, sample_project: Project
     ) -> None:
@@ -235,15 +246,16 @@ class TestProjectList:
         assert mock_session_state['modal_project'] == sample_project
         mock_modal.open.assert_called_once()
 
-    def test_実行ボタンが押された場合にプロジェクトが実行される(
+    def test_実行ボタンが押された場合にプロジェクトがバックグラウンドで実行される(
         self, mocker: MockerFixture
     ) -> None:
         # Arrange
-        mock_session_state: dict[str, object] = {}
-        mock_session_state['running_workers'] = {}
+        mock_session_state = MockSessionState({'running_workers': {}})
         mocker.patch.object(project_list.st, 'session_state', mock_session_state)
         mock_success = mocker.patch.object(project_list.st, 'success')
         mock_rerun = mocker.patch.object(project_list.st, 'rerun')
+        mock_executor = Mock()
+        mocker.patch.object(project_list, 'get_execution_executor', return_value=mock_executor)
 
         sample_project = Project(
             name='テストプロジェクト',
@@ -252,7 +264,6 @@ class TestProjectList:
         )
 
         mock_project_service = Mock()
-        mock_project_service.execute_project.return_value = (sample_project, '実行成功')
 
         button_state = {'detail_btn': False, 'exec_btn': True}
 
@@ -262,18 +273,45 @@ class TestProjectList:
         )
 
         # Assert
-        mock_project_service.execute_project.assert_called_once_with(sample_project.id)
-        mock_success.assert_called_once_with('実行成功')
+        mock_executor.submit.assert_called_once_with(
+            mock_project_service.execute_project, sample_project.id
+        )
+        future = mock_executor.submit.return_value
+        assert mock_session_state['running_workers'] == {sample_project.id: future}
+        mock_success.assert_called_once_with('プロジェクトの実行を開始しました。')
         mock_rerun.assert_called_once()
 
-    def test_実行ボタンが押された場合にエラーが発生するとエラーメッセージが表示される(
+    def test_running_workers未初期化でも実行を開始できる(self, mocker: MockerFixture) -> None:
+        # Arrange
+        mock_session_state = MockSessionState()
+        mocker.patch.object(project_list.st, 'session_state', mock_session_state)
+        mock_executor = Mock()
+        mocker.patch.object(project_list, 'get_execution_executor', return_value=mock_executor)
+        sample_project = Project(
+            name='テストプロジェクト',
+            source='/path/to/source',
+            tool=ToolType.OVERVIEW,
+        )
+
+        # Act
+        success, _ = project_list._start_project_execution(sample_project, Mock())
+
+        # Assert
+        assert success is True
+        assert mock_session_state['running_workers'] == {
+            sample_project.id: mock_executor.submit.return_value
+        }
+
+    def test_実行の開始に失敗した場合はエラーメッセージが表示される(
         self, mocker: MockerFixture
     ) -> None:
         # Arrange
-        mock_session_state: dict[str, object] = {}
-        mock_session_state['running_workers'] = {}
+        mock_session_state = MockSessionState({'running_workers': {}})
         mocker.patch.object(project_list.st, 'session_state', mock_session_state)
         mock_error = mocker.patch.object(project_list.st, 'error')
+        mock_executor = Mock()
+        mock_executor.submit.side_effect = RuntimeError('cannot schedule new futures')
+        mocker.patch.object(project_list, 'get_execution_executor', return_value=mock_executor)
 
         sample_project = Project(
             name='テストプロジェクト',
@@ -281,19 +319,92 @@ class TestProjectList:
             tool=ToolType.OVERVIEW,
         )
 
-        mock_project_service = Mock()
-        mock_project_service.execute_project.return_value = (None, '実行失敗')
-
         button_state = {'detail_btn': False, 'exec_btn': True}
 
         # Act
-        project_list._handle_project_buttons(
-            button_state, sample_project, Mock(), mock_project_service
+        project_list._handle_project_buttons(button_state, sample_project, Mock(), Mock())
+
+        # Assert
+        mock_error.assert_called_once_with('予期しないエラーが発生しました。')
+        assert mock_session_state['running_workers'] == {}
+
+    def test_完了した実行の結果は次の描画で表示される(self, mocker: MockerFixture) -> None:
+        # Arrange
+        sample_project = Project(name='テストプロジェクト', source='/path', tool=ToolType.OVERVIEW)
+        completed: Future[tuple[Project | None, str]] = Future()
+        completed.set_result((sample_project, 'プロジェクトの実行が完了しました'))
+        failed: Future[tuple[Project | None, str]] = Future()
+        failed.set_result((None, 'レビュー対象のファイルが見つかりません'))
+        mock_session_state = MockSessionState(
+            {'running_workers': {uuid4(): completed, uuid4(): failed}}
         )
+        mocker.patch.object(project_list.st, 'session_state', mock_session_state)
+        mocker.patch.object(project_list.st, 'header')
+        mocker.patch.object(project_list.st, 'info')
+        mock_success = mocker.patch.object(project_list.st, 'success')
+        mock_error = mocker.patch.object(project_list.st, 'error')
+
+        # Act
+        assert project_list.prune_finished_workers() == frozenset()
+        project_list.render_project_list([], Mock(), Mock())
+        project_list.render_project_list([], Mock(), Mock())
+
+        # Assert
+        mock_success.assert_called_once_with('プロジェクトの実行が完了しました')
+        mock_error.assert_called_once_with('レビュー対象のファイルが見つかりません')
+
+    def test_実行が例外で終了した場合はエラーメッセージを表示する(
+        self, mocker: MockerFixture
+    ) -> None:
+        # Arrange
+        mock_logger = mocker.patch.object(project_list, 'logger')
+        future: Future[tuple[Project | None, str]] = Future()
+        future.set_exception(RuntimeError('実行失敗'))
+
+        # Act
+        result = project_list._get_execution_result(future)
+
+        # Assert
+        assert result == (False, '予期しないエラーが発生しました。')
+        mock_logger.error.assert_called_once()
+
+    def test_完了した実行はrunning_workersから取り除かれる(self, mocker: MockerFixture) -> None:
+        # Arrange
+        running: Future[tuple[Project | None, str]] = Future()
+        finished: Future[tuple[Project | None, str]] = Future()
+        finished.set_result((None, '完了'))
+        running_id, finished_id = uuid4(), uuid4()
+        mock_session_state = MockSessionState(
+            {'running_workers': {running_id: running, finished_id: finished}}
+        )
+        mocker.patch.object(project_list.st, 'session_state', mock_session_state)
+        mocker.patch.object(project_list.st, 'header')
+        mocker.patch.object(project_list.st, 'info')
+
+        # Act
+        project_list.render_project_list([], Mock(), Mock())
+
+        # Assert
+        assert mock_session_state['running_workers'] == {running_id: running}
+
+    def test_実行中かどうかを各行に渡す(self, mocker: MockerFixture) -> None:
+        # Arrange
+        running: Future[tuple[Project | None, str]] = Future()
+        projects = [
+            Project(name=f'プロジェクト{i}', source=f'/path{i}', tool=ToolType.OVERVIEW)
+            for i in range(2)
+        ]
+        mock_session_state = MockSessionState({'running_workers': {projects[1].id: running}})
+        mocker.patch.object(project_list.st, 'session_state', mock_session_state)
+        mocker.patch.object(project_list.st, 'header')
+        mocker.patch.object(project_list, '_render_header_columns')
+        mock_row = mocker.patch.object(project_list, '_render_project_row')
+
+        # Act
+        project_list.render_project_list(projects, Mock(), Mock())
 
         # Assert
-        mock_project_service.execute_project.assert_called_once_with(sample_project.id)
-        mock_error.assert_called_once_with('実行失敗')
+        assert [c.kwargs['is_running'] for c in mock_row.call_args_list] == [False, True]
 
     def test_ボタンが押されない場合は何も起こらない(self, mocker: MockerFixture) -> None:
         # Arrange
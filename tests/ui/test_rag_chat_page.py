@@ -1,6 +1,9 @@
 """RAGチャットページのテスト。"""
 
+import os
+import pickle
 from datetime import datetime
+from pathlib import Path
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
@@ -10,6 +13,7 @@ from app.models.project import Project
 from app.repositories.project_repository import JsonProjectRepository
 from app.services.project_service import ProjectService
 from app.types import ProjectID, ToolType
+from app.ui import rag_chat_page
 from app.ui.rag_chat_page import RAGChatPage
 
 
@@ -24,8 +28,6 @@ class TestRAGChatPage:
         mock_st = mocker.patch('app.ui.rag_chat_page.st')
         mock_session_state = mocker.MagicMock()
         mock_st.session_state = mock_session_state
-        # セッション状態のキーが存在しない場合のモック
-        mock_session_state.__contains__ = mocker.MagicMock(return_value=False)
 
         # Act
         page = RAGChatPage(mock_project_service, mock_project_repo)
@@ -34,7 +36,13 @@ class TestRAGChatPage:
         assert page.project_service == mock_project_service
         assert page.project_repo == mock_project_repo
         # セッション状態の初期化が呼び出されることを確認
-        assert mock_session_state.__contains__.call_count >= 3
+        mock_session_state.setdefault.assert_has_calls(
+            [
+                mocker.call('selected_project_id', None),
+                mocker.call('chat_messages', []),
+                mocker.call('rag_logs', []),
+            ]
+        )
 
     def test_プロジェクト選択でIDが表示されない(self, mocker: MockerFixture) -> None:
         """プロジェクト選択時にIDが表示されないことをテストする。"""
@@ -77,6 +85,25 @@ class TestRAGChatPage:
         for name in project_names:
             assert name in ['テストプロジェクト1', 'テストプロジェクト2']
 
+    def test_前回選択したプロジェクトが初期選択される(self, mocker: MockerFixture) -> None:
+        """セッションに保存されたプロジェクトIDの位置が初期選択になることをテストする。"""
+        # Arrange
+        mock_st = mocker.patch('app.ui.rag_chat_page.st')
+        projects = [
+            Project(name=f'プロジェクト{i}', source=f'/path{i}', tool=ToolType.OVERVIEW)
+            for i in range(3)
+        ]
+        mock_st.session_state.selected_project_id = projects[2].id
+        page = RAGChatPage(
+            mocker.MagicMock(spec=ProjectService), mocker.MagicMock(spec=JsonProjectRepository)
+        )
+
+        # Act
+        default_index = page._get_default_project_index({p.name: p for p in projects})
+
+        # Assert
+        assert default_index == 2
+
     def test_インデックス再構築が正常に実行される(self, mocker: MockerFixture) -> None:
         """インデックス再構築が正常に実行されることをテストする。"""
         # Arrange
@@ -241,3 +268,77 @@ class TestRAGChatPage:
         # Assert
         mock_st.columns.assert_called_once_with([3, 1])
         mock_st.button.assert_called_once_with('インデックス再構築', key='rebuild_indexes')
+
+    def test_検索結果のログはまとめて1回だけ表示を更新する(self, mocker: MockerFixture) -> None:
+        """検索結果ログが複数行でも表示更新が1回で済むことをテストする。"""
+        # Arrange
+        mock_st = mocker.patch('app.ui.rag_chat_page.st')
+        mock_placeholder = mocker.MagicMock()
+        mock_st.session_state = mocker.MagicMock()
+        mock_st.session_state.__contains__ = mocker.MagicMock(return_value=True)
+        mock_st.session_state.rag_logs = []
+        mock_st.session_state.rag_log_placeholder = mock_placeholder
+        page = RAGChatPage(
+            mocker.MagicMock(spec=ProjectService), mocker.MagicMock(spec=JsonProjectRepository)
+        )
+        results = [
+            {'path': 'a.md', 'score': 0.9, 'content': '本文A'},
+            {'path': 'b.md', 'score': 0.5, 'content': '本文B'},
+        ]
+
+        # Act
+        page._log_semantic_results(results)
+
+        # Assert
+        assert mock_st.session_state.rag_logs == [
+            '【セマンティック検索結果】',
+            '  [1] a.md [score=0.900]',
+            '     本文A...',
+            '  [2] b.md [score=0.500]',
+            '     本文B...',
+        ]
+        mock_placeholder.code.assert_called_once()
+
+    def test_検索結果ログの本文プレビューは先頭のみ表示する(self, mocker: MockerFixture) -> None:
+        """長いチャンク本文がログ上で切り詰められることをテストする。"""
+        # Arrange
+        mock_st = mocker.patch('app.ui.rag_chat_page.st')
+        mock_st.session_state = mocker.MagicMock()
+        mock_st.session_state.__contains__ = mocker.MagicMock(return_value=False)
+        mock_st.session_state.rag_logs = []
+        page = RAGChatPage(
+            mocker.MagicMock(spec=ProjectService), mocker.MagicMock(spec=JsonProjectRepository)
+        )
+
+        # Act
+        page._log_keyword_results([{'path': 'a.md', 'score': 1.0, 'content': 'あ' * 500}])
+
+        # Assert
+        assert mock_st.session_state.rag_logs[2] == f'     {"あ" * 100}...'
+
+    def test_BM25インデックスは更新されるまで再利用される(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """BM25インデックスが更新時刻の変化まで再読み込みされないことをテストする。"""
+        # Arrange
+        rag_chat_page._load_bm25_files.clear()
+        mocker.patch('app.ui.rag_chat_page.st')
+        index_path = tmp_path / 'bm25_index.pkl'
+        index_path.write_bytes(pickle.dumps(['v1']))
+        (tmp_path / 'metadata.pkl').write_bytes(pickle.dumps([{'path': 'a.md'}]))
+        os.utime(index_path, ns=(1_000_000_000, 1_000_000_000))
+        page = RAGChatPage(
+            mocker.MagicMock(spec=ProjectService), mocker.MagicMock(spec=JsonProjectRepository)
+        )
+
+        # Act
+        first, _ = page._load_bm25_index(tmp_path)
+        second, _ = page._load_bm25_index(tmp_path)
+        index_path.write_bytes(pickle.dumps(['v2']))
+        os.utime(index_path, ns=(2_000_000_000, 2_000_000_000))
+        reloaded, _ = page._load_bm25_index(tmp_path)
+        rag_chat_page._load_bm25_files.clear()
+
+        # Assert
+        assert first is second
+        assert reloaded == ['v2']
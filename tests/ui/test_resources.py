@@ -0,0 +1,124 @@
+"""共有リソース取得関数のテスト。"""
+
+import json
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.models.project import Project
+from app.repositories.sqlite_project_repository import SqliteProjectRepository
+from app.types import ToolType
+from app.ui import resources
+
+
+@pytest.fixture(autouse=True)
+def clear_resource_cache() -> Generator[None, None, None]:
+    """テスト間でキャッシュが共有されないようにクリアする。"""
+    resources.get_project_repository.clear()
+    resources.get_project_service.clear()
+    resources._load_projects.clear()
+    resources._load_source_dirs.clear()
+    yield
+    resources.get_project_repository.clear()
+    resources.get_project_service.clear()
+    resources._load_projects.clear()
+    resources._load_source_dirs.clear()
+
+
+class TestResources:
+    """共有リソース取得関数のテストクラス。"""
+
+    def test_同じデータディレクトリでは同一のリポジトリが返される(self, tmp_path: Path) -> None:
+        """同じデータディレクトリに対してリポジトリが再利用されることをテストする。"""
+        # Act
+        first = resources.get_project_repository(tmp_path)
+        second = resources.get_project_repository(tmp_path)
+
+        # Assert
+        assert first is second
+
+    def test_設定でSQLiteの保存形式を選択できる(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """PROJECT_STOREがsqliteの場合にSQLiteリポジトリが使われることをテストする。"""
+        # Arrange
+        mocker.patch.object(resources, 'get_config').return_value.project_store = 'sqlite'
+
+        # Act
+        repository = resources.get_project_repository(tmp_path)
+
+        # Assert
+        assert isinstance(repository, SqliteProjectRepository)
+        repository.close()
+
+    def test_サービスはキャッシュ済みリポジトリを利用する(self, tmp_path: Path) -> None:
+        """サービスが共有リポジトリを保持し、再利用されることをテストする。"""
+        # Act
+        service = resources.get_project_service(tmp_path)
+
+        # Assert
+        assert service is resources.get_project_service(tmp_path)
+        assert service.repository is resources.get_project_repository(tmp_path)
+
+    def test_プロジェクト一覧は保存先が更新されるまでキャッシュされる(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """保存先が変わらない間は一覧を再読み込みせず、保存後は読み直すことをテストする。"""
+        # Arrange
+        repository = resources.get_project_repository(tmp_path)
+        find_all_spy = mocker.spy(repository, 'find_all')
+        assert resources.load_projects(tmp_path) == []
+
+        # Act
+        cached = resources.load_projects(tmp_path)
+        repository.save(Project(name='新規', source='/path', tool=ToolType.OVERVIEW))
+        reloaded = resources.load_projects(tmp_path)
+
+        # Assert
+        assert cached == []
+        assert [p.name for p in reloaded] == ['新規']
+        assert find_all_spy.call_count == 2
+
+    def test_更新時刻が同じでもサイズが変われば一覧を読み直す(self, tmp_path: Path) -> None:
+        """同じ更新時刻内に書き換えられた場合でも、新しい内容を返すことをテストする。"""
+        # Arrange
+        repository = resources.get_project_repository(tmp_path)
+        repository.save(Project(name='元の名前', source='/path', tool=ToolType.OVERVIEW))
+        assert [p.name for p in resources.load_projects(tmp_path)] == ['元の名前']
+        projects_file = tmp_path / 'projects.json'
+        stat = projects_file.stat()
+        data = json.loads(projects_file.read_text(encoding='utf-8'))
+        data[0]['name'] = '外部で更新された名前'
+        projects_file.write_text(json.dumps(data), encoding='utf-8')
+        os.utime(projects_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # Act
+        projects = resources.load_projects(tmp_path)
+
+        # Assert
+        assert [p.name for p in projects] == ['外部で更新された名前']
+
+    def test_対象ディレクトリ一覧はディレクトリが更新されるまでキャッシュされる(
+        self, tmp_path: Path
+    ) -> None:
+        """エントリが変わらない間は一覧を再走査せず、追加後は読み直すことをテストする。"""
+        # Arrange
+        (tmp_path / 'first').mkdir()
+        (tmp_path / 'file.txt').write_text('content')
+        assert resources.load_source_dirs(tmp_path) == ['first']
+        stat = tmp_path.stat()
+
+        # Act
+        (tmp_path / 'second').mkdir()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        cached = resources.load_source_dirs(tmp_path)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        reloaded = resources.load_source_dirs(tmp_path)
+
+        # Assert
+        assert cached == ['first']
+        assert sorted(reloaded) == ['first', 'second']
+        assert resources.load_source_dirs(tmp_path / 'missing') == []
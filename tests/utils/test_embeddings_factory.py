@@ -0,0 +1,48 @@
+"""Embeddingsモデルファクトリーのテスト。"""
+
+from collections.abc import Generator
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.types import LLMProviderName
+from app.utils import embeddings_factory
+
+
+@pytest.fixture(autouse=True)
+def clear_embeddings_cache() -> Generator[None, None, None]:
+    """テスト間でキャッシュが共有されないようにクリアする。"""
+    embeddings_factory.get_embeddings_model.cache_clear()
+    yield
+    embeddings_factory.get_embeddings_model.cache_clear()
+
+
+class TestGetEmbeddingsModel:
+    """get_embeddings_model関数のテストクラス。"""
+
+    def test_同じプロバイダではモデルが再利用される(self, mocker: MockerFixture) -> None:
+        """同じプロバイダに対して埋め込みモデルが1度だけ生成されることをテストする。"""
+        # Arrange
+        mock_embeddings = mocker.patch.object(embeddings_factory, 'OpenAIEmbeddings')
+
+        # Act
+        first = embeddings_factory.get_embeddings_model(LLMProviderName.OPENAI)
+        second = embeddings_factory.get_embeddings_model(LLMProviderName.OPENAI)
+
+        # Assert
+        assert first is second
+        mock_embeddings.assert_called_once()
+
+    def test_プロバイダごとに別のモデルが生成される(self, mocker: MockerFixture) -> None:
+        """異なるプロバイダではそれぞれのモデルが生成されることをテストする。"""
+        # Arrange
+        mock_openai = mocker.patch.object(embeddings_factory, 'OpenAIEmbeddings')
+        mock_gemini = mocker.patch.object(embeddings_factory, 'GoogleGenerativeAIEmbeddings')
+
+        # Act
+        openai_model = embeddings_factory.get_embeddings_model(LLMProviderName.OPENAI)
+        gemini_model = embeddings_factory.get_embeddings_model(LLMProviderName.GEMINI)
+
+        # Assert
+        assert openai_model is mock_openai.return_value
+        assert gemini_model is mock_gemini.return_value
@@ -0,0 +1,49 @@
+"""ファイルシステム操作のテスト。"""
+
+from pathlib import Path
+
+from app.utils.file_system import RealFileSystem
+
+
+class TestRealFileSystem:
+    """RealFileSystemのテストクラス。"""
+
+    def test_書き込んだ内容を読み込める(self, tmp_path: Path) -> None:
+        """書き込んだ文字列がそのまま読み込めることをテストする。"""
+        # Arrange
+        file_system = RealFileSystem()
+        path = tmp_path / 'nested' / 'result.txt'
+        content = '# 概要\n\n日本語のテキスト\n'
+
+        # Act
+        file_system.write_file(path, content)
+
+        # Assert
+        assert file_system.read_file(path) == content
+        assert path.read_bytes() == content.encode('utf-8')
+
+    def test_指定したエンコーディングで書き込まれる(self, tmp_path: Path) -> None:
+        """エンコーディング指定が書き込みに反映されることをテストする。"""
+        # Arrange
+        file_system = RealFileSystem()
+        path = tmp_path / 'sjis.txt'
+
+        # Act
+        file_system.write_file(path, '日本語', encoding='shift_jis')
+
+        # Assert
+        assert path.read_bytes() == '日本語'.encode('shift_jis')
+        assert file_system.read_file(path, encoding='shift_jis') == '日本語'
+
+    def test_読み込み時に改行コードがLFに揃えられる(self, tmp_path: Path) -> None:
+        """CRLFやCRの改行がテキストモード同様にLFへ変換されることをテストする。"""
+        # Arrange
+        file_system = RealFileSystem()
+        path = tmp_path / 'crlf.txt'
+        path.write_bytes(b'line1\r\nline2\rline3\n')
+
+        # Act
+        content = file_system.read_file(path)
+
+        # Assert
+        assert content == 'line1\nline2\nline3\n'
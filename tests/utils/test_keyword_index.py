@@ -56,6 +56,23 @@ class TestKeywordIndexBuilder:
             assert not (index_dir / 'bm25_index.pkl').exists()
             assert not (index_dir / 'metadata.pkl').exists()
 
+    def test_インデックス出力ディレクトリと対象外の拡張子は収集しない(self, tmp_path: Path) -> None:
+        """インデックス出力ディレクトリ配下と対象外拡張子のファイルを除外する。"""
+        # Arrange
+        builder = KeywordIndexBuilder()
+        (tmp_path / 'docs').mkdir()
+        (tmp_path / 'docs' / 'guide.md').write_text('ガイド', encoding='utf-8')
+        (tmp_path / 'main.py').write_text('print(1)', encoding='utf-8')
+        (tmp_path / 'image.png').write_bytes(b'')
+        (tmp_path / 'keyword_db').mkdir()
+        (tmp_path / 'keyword_db' / 'notes.txt').write_text('除外', encoding='utf-8')
+
+        # Act
+        paths = sorted(doc.metadata['path'] for doc in builder._collect_documents(tmp_path))
+
+        # Assert
+        assert paths == [str(Path('docs') / 'guide.md'), 'main.py']
+
     def test_ドキュメントの収集とインデックス作成(self) -> None:
         """有効なドキュメントが存在する場合、インデックスを作成する。"""
         # Arrange